@@ -6,32 +6,201 @@ Date: July 2025
 License: MIT
 """
 
+import asyncio
 import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import lxml.html
+import numpy as np
 from langchain.agents import AgentType, initialize_agent
-from langchain.callbacks.manager import CallbackManagerForToolRun
-from langchain.chains import LLMChain
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
 from langchain.prompts import PromptTemplate
-from langchain_community.document_loaders import WebBaseLoader
 from langchain_community.tools import BaseTool, Tool
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable
 from langchain_google_genai import ChatGoogleGenerativeAI
 
-from config import ResearchError
-from models import CompactMemory, ResearchTask, TaskType
+from config import ResearchError, get_date_context
+from models import (
+    CompactMemory,
+    ResearchTask,
+    SemanticCache,
+    TaskScores,
+    TaskType,
+    WebPageCache,
+)
 
 logger = logging.getLogger(__name__)
 
+# Shared static prefix for all research task prompts
+SHARED_RESEARCH_PREAMBLE = """Research the topic given at the end of this prompt using the available tools.
+Prefer recent sources as of the given date and follow the focus line when present.
+Keep the answer factual, specific and in simple language.
+
+"""
+
+# Task-specific static instructions, appended after the shared preamble
+_TASK_INSTRUCTIONS = {
+    TaskType.OVERVIEW_RESEARCH: """Find basic info about the topic.
+
+Search for recent info and provide:
+- What it is (simple explanation)
+- Why it matters
+- Current status in 2025
+- Key facts and numbers
+
+Keep it simple and clear. 300-500 words max.
+""",
+    
+    TaskType.CURRENT_TRENDS: """Find latest news about the topic.
+
+Search for 2025 updates and provide:
+- Recent developments
+- New statistics or data
+- Market changes
+- What's happening now
+
+Focus on current year only. 200-400 words max.
+""",
+    
+    TaskType.DETAILED_ANALYSIS: """Find expert views on the topic.
+
+Search for analysis and provide:
+- Expert opinions
+- Real-world examples
+- Benefits and challenges
+- What it means for people
+
+Use simple language. 200-400 words max.
+""",
+}
+
+# Tool-free variants for tasks answered by the model directly; the prompt
+# must not promise searches the model cannot run
+DIRECT_ANSWER_PREAMBLE = """Answer about the topic given at the end of this prompt from your own knowledge.
+No tools or web search are available; say so where facts may have changed since your training data.
+Follow the focus line when present. Keep the answer factual, specific and in simple language.
+
+"""
+
+_DIRECT_TASK_INSTRUCTIONS = {
+    TaskType.OVERVIEW_RESEARCH: """Explain the basics of the topic.
+
+Provide:
+- What it is (simple explanation)
+- Why it matters
+- Key facts and numbers you are confident about
+
+Keep it simple and clear. 300-500 words max.
+""",
+}
+
+# Analysis prompt, parsed once at import
+_ANALYSIS_PROMPT = PromptTemplate(
+    input_variables=["research_content", "focus_areas"],
+    template="""
+Analyze the research below and extract key points.
+
+Provide in simple language:
+1. Top 3 key points
+2. Important numbers or facts
+3. Main trends
+4. What this means for people
+
+Keep it brief and easy to understand.
+
+Focus areas: {focus_areas}
+
+Research:
+{research_content}
+"""
+)
+
+# Adaptive report prompt that responds to content and focus
+_REPORT_PROMPT = PromptTemplate(
+    input_variables=["topic", "research_content", "analysis", "focus_areas"],
+    template="""
+            Write a friendly, easy-to-read article about the topic given at the end.
+
+            Based on the research content and focus areas provided, intelligently organize the information into relevant sections. Let the content guide the structure - create section headings that naturally emerge from what you discovered in the research.
+
+            Structure:
+            # [Topic]: What You Need to Know
+
+            ## Introduction
+            Brief, friendly intro explaining what this is about and why it matters.
+
+            [Analyze the research content and focus areas, then create 3-4 meaningful sections with headings that reflect the actual findings. Each section should cover the most important aspects discovered in the research.]
+
+            ## What This Means for You
+            Practical takeaways and real-world impact.
+
+            ## Looking Ahead
+            Simple summary of future trends and what to expect.
+
+            Guidelines:
+            - Let the research content determine the section headings and organization
+            - Use simple words instead of complex terms
+            - Explain technical concepts in everyday language
+            - Include specific facts and numbers when available
+            - Keep paragraphs short and readable
+            - Target 2000-2500 words total
+            - Make it conversational and engaging
+            - Focus on what's most relevant and interesting from your research
+
+            Topic: {topic}
+            Focus areas: {focus_areas}
+            Key insights: {analysis}
+            Research: {research_content}
+            """
+)
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Approximate Gemini token count without a tokenizer round trip.
+
+    ASCII text averages about four characters per token; non-ASCII
+    characters are counted as a token each, which errs on the safe side.
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return -(-ascii_chars // 4) + (len(text) - ascii_chars)
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Return the longest prefix of text estimated to fit in max_tokens."""
+    if _estimate_tokens(text) <= max_tokens:
+        return text
+    
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if _estimate_tokens(text[:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    
+    return text[:low]
+
 
 class SmartPlanner:
     """Intelligent research task planner with focus area optimization."""
     
-    def __init__(self, llm: ChatGoogleGenerativeAI):
+    def __init__(self, llm: ChatGoogleGenerativeAI, memory: Optional[CompactMemory] = None):
         if not isinstance(llm, ChatGoogleGenerativeAI):
             raise TypeError("llm must be a ChatGoogleGenerativeAI instance")
         
         self.llm = llm
-        self.memory = CompactMemory()
+        self.memory = memory if memory is not None else CompactMemory()
         logger.info("Smart planner initialized")
     
     def create_research_plan(self, topic: str) -> List[ResearchTask]:
@@ -40,76 +209,301 @@ class SmartPlanner:
             raise ValueError("Research topic cannot be empty")
         
         topic = topic.strip()
-        current_year = datetime.now().year
+        _, _, current_year = get_date_context()
         
-        logger.info(f"Creating research plan for: {topic}")
+        logger.info("Creating research plan for: %s", topic)
         
         try:
             tasks = [
                 ResearchTask(
                     task_type=TaskType.OVERVIEW_RESEARCH,
                     description=f"Core concepts and {current_year} basics of {topic}",
-                    max_tokens=800
+                    max_tokens=800,
+                    topic=topic
                 ),
                 ResearchTask(
                     task_type=TaskType.CURRENT_TRENDS,
                     description=f"{current_year} trends and news about {topic}",
-                    max_tokens=600
+                    max_tokens=600,
+                    topic=topic
                 ),
                 ResearchTask(
                     task_type=TaskType.DETAILED_ANALYSIS,
                     description=f"Expert insights and practical info on {topic}",
-                    max_tokens=600
+                    max_tokens=600,
+                    topic=topic
                 )
             ]
             
-            logger.info(f"Created {len(tasks)} optimized research tasks")
+            logger.info("Created %s optimized research tasks", len(tasks))
             return tasks
             
         except Exception as e:
-            logger.error(f"Failed to create research plan: {str(e)}")
+            logger.error("Failed to create research plan: %s", e)
             raise ResearchError(f"Could not create research plan: {str(e)}")
 
 
+# Shared HTTP settings for the website tools
+_HTTP_TIMEOUT = 10.0
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+# Raw bytes read per page; plenty for ~1000 characters of extracted text
+_MAX_PAGE_BYTES = 64 * 1024
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+_page_cache: Optional[WebPageCache] = None
+
+
+def _http_headers() -> Dict[str, str]:
+    """Request headers for page fetches."""
+    return {"User-Agent": os.getenv("USER_AGENT", "AI Research Assistant v1.0")}
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide keep-alive client used by WebsiteSearchTool."""
+    global _http_client
+    
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                headers=_http_headers(),
+                timeout=_HTTP_TIMEOUT,
+                limits=_HTTP_LIMITS,
+                follow_redirects=True,
+            )
+        return _http_client
+
+
+def _get_page_cache() -> WebPageCache:
+    """Return the process-wide page text cache shared by the website tools."""
+    global _page_cache
+    
+    with _http_client_lock:
+        if _page_cache is None:
+            _page_cache = WebPageCache()
+        return _page_cache
+
+
+def _validate_url(url: str) -> Optional[str]:
+    """Return an error message for an unusable URL, or None."""
+    if not url:
+        return "Error: No URL provided"
+    if not (url.startswith("http://") or url.startswith("https://")):
+        return f"Error: Invalid URL: {url}"
+    return None
+
+
+def _lookup_page(url: str, memory: Optional[CompactMemory]) -> Optional[str]:
+    """Return page text from the shared in-process memory, then the disk cache."""
+    if memory is not None:
+        summary = memory.get_page_summary(url)
+        if summary is not None:
+            return summary
+    
+    # Disk hits are not copied into memory: that would restart the TTL for
+    # text that may already be close to an hour old
+    return _get_page_cache().get(url)
+
+
+def _store_page(url: str, content: str, memory: Optional[CompactMemory]) -> None:
+    """Record freshly extracted page text in memory and on disk."""
+    if memory is not None:
+        memory.remember_page(url, content)
+    _get_page_cache().set(url, content)
+
+
+# Site chrome: the elements that hold it, and lines that consist of nothing
+# but a chrome link or copyright notice. Whole lines only, so no sentence
+# that merely mentions a privacy policy or signing up is touched
+_CHROME_XPATH = (
+    "//script | //style | //noscript | //nav | //header | //footer | //aside | //form"
+    " | //body//*[@id or @class][re:test(concat(@id, ' ', @class),"
+    " 'cookie|newsletter|subscribe|related|footer|banner', 'i')]"
+)
+_BOILERPLATE_LINE_RE = re.compile(
+    r"^\W*(?:(?:cookie policy|privacy policy|subscribe|sign up|related articles)\W*"
+    r"|(?:©|copyright\b).{0,80}\ball rights reserved\W*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _page_text(html: bytes, max_length: int) -> str:
+    """Extract visible text from an HTML page, without site chrome, and truncate it."""
+    if not html.strip():
+        return ""
+    
+    tree = lxml.html.fromstring(html)
+    for element in tree.xpath(
+        _CHROME_XPATH, namespaces={"re": "http://exslt.org/regular-expressions"}
+    ):
+        element.drop_tree()
+    
+    # Lines still follow the page's markup here, so chrome lines can be
+    # dropped before the whitespace is collapsed
+    text = _BOILERPLATE_LINE_RE.sub("", tree.text_content())
+    content = " ".join(text.split())
+    
+    if len(content) > max_length:
+        content = content[:max_length] + "..."
+    
+    return content
+
+
 class WebsiteSearchTool(BaseTool):
     """Optimized website content extraction tool."""
     
     name: str = "website_search"
     description: str = "Get key info from websites. Input: URL"
+    memory: Optional[CompactMemory] = None  # Shared across a plan's tasks
     
     _MAX_CONTENT_LENGTH = 1000  # Reduced from 2000
     
     def _run(self, url: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
-        if not url or not url.strip():
-            return "Error: No URL provided"
-        
-        url = url.strip()
+        url = (url or "").strip()
         
-        if not (url.startswith("http://") or url.startswith("https://")):
-            return f"Error: Invalid URL: {url}"
+        error = _validate_url(url)
+        if error:
+            return error
         
         try:
-            loader = WebBaseLoader(url)
-            documents = loader.load()
-            
-            if not documents:
-                return f"No content found at {url}"
+            cached = _lookup_page(url, self.memory)
+            if cached is not None:
+                return cached
             
-            content = documents[0].page_content
+            with _get_http_client().stream("GET", url) as response:
+                response.raise_for_status()
+                html = bytearray()
+                for chunk in response.iter_bytes():
+                    html += chunk
+                    if len(html) >= _MAX_PAGE_BYTES:
+                        break
             
-            if len(content) > self._MAX_CONTENT_LENGTH:
-                content = content[:self._MAX_CONTENT_LENGTH] + "..."
+            content = _page_text(bytes(html), self._MAX_CONTENT_LENGTH)
+            if not content:
+                return f"No content found at {url}"
             
+            _store_page(url, content, self.memory)
             return content
             
         except Exception as e:
             return f"Error: {str(e)}"
+    
+    async def _arun(
+        self, url: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None
+    ) -> str:
+        # The pooled client is synchronous; keep it off the event loop
+        return await asyncio.to_thread(self._run, url)
+
+
+class WebsiteBatchSearchTool(BaseTool):
+    """Fetches several websites concurrently in a single tool call."""
+    
+    name: str = "website_search_batch"
+    description: str = (
+        "Get key info from several websites at once. "
+        "Input: comma-separated list of URLs"
+    )
+    memory: Optional[CompactMemory] = None  # Shared across a plan's tasks
+    
+    _MAX_CONTENT_LENGTH = 1000
+    _MAX_URLS = 5
+    _MAX_CONCURRENCY = 5
+    
+    def _run(self, urls: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
+        return asyncio.run(self._arun(urls))
+    
+    async def _arun(
+        self, urls: str, run_manager: Optional[AsyncCallbackManagerForToolRun] = None
+    ) -> str:
+        url_list = [url.strip() for url in (urls or "").split(",") if url.strip()]
+        if not url_list:
+            return "Error: No URL provided"
+        
+        url_list = url_list[:self._MAX_URLS]
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENCY)
+        
+        async with httpx.AsyncClient(
+            headers=_http_headers(),
+            timeout=_HTTP_TIMEOUT,
+            limits=_HTTP_LIMITS,
+            follow_redirects=True,
+        ) as client:
+            
+            async def fetch(url: str) -> str:
+                error = _validate_url(url)
+                if error:
+                    return error
+                
+                try:
+                    cached = await asyncio.to_thread(_lookup_page, url, self.memory)
+                    if cached is not None:
+                        return cached
+                    
+                    html = bytearray()
+                    async with semaphore:
+                        async with client.stream("GET", url) as response:
+                            response.raise_for_status()
+                            async for chunk in response.aiter_bytes():
+                                html += chunk
+                                if len(html) >= _MAX_PAGE_BYTES:
+                                    break
+                    
+                    content = _page_text(bytes(html), self._MAX_CONTENT_LENGTH)
+                    if not content:
+                        return f"No content found at {url}"
+                    
+                    await asyncio.to_thread(_store_page, url, content, self.memory)
+                    return content
+                    
+                except Exception as e:
+                    return f"Error: {str(e)}"
+            
+            pages = await asyncio.gather(*(fetch(url) for url in url_list))
+        
+        return "\n\n".join(f"{url}:\n{page}" for url, page in zip(url_list, pages))
 
 
 class EfficientResearcher:
     """Token-optimized research agent with focus area integration."""
     
-    def __init__(self, llm: ChatGoogleGenerativeAI, tools: List[Tool]):
+    MAX_CONCURRENT_TASKS = 3
+    
+    # ReAct loop bounds; the overview rarely needs more than one search
+    DEFAULT_MAX_ITERATIONS = 3
+    MAX_EXECUTION_TIME = 45  # seconds
+    TASK_ITERATIONS = {
+        TaskType.OVERVIEW_RESEARCH: 2,
+        TaskType.CURRENT_TRENDS: 3,
+        TaskType.DETAILED_ANALYSIS: 3,
+    }
+    
+    _DIGITS = frozenset("0123456789")
+    
+    # Tool-free fast path for background questions on timeless topics
+    DIRECT_ANSWER_TASKS = frozenset({TaskType.OVERVIEW_RESEARCH})
+    DIRECT_PROMPT_MAX_CHARS = 1200
+    _DATE_SENSITIVE_RE = re.compile(
+        r"\b(?:19|20)\d{2}\b|\b(?:latest|recent|current|today|news|upcoming|forecast|"
+        r"this (?:week|month|year))\b",
+        re.IGNORECASE,
+    )
+    
+    # Weights for (word count, credibility, digits) in batch scoring
+    _QUALITY_WEIGHTS = np.array([0.4, 0.3, 0.3], dtype=np.float32)
+    
+    # Single-pass scan for all credibility indicators
+    _CREDIBILITY_RE = re.compile("|".join(
+        re.escape(indicator) for indicator in ("study", "research", "according to")
+    ))
+    
+    def __init__(
+        self, 
+        llm: ChatGoogleGenerativeAI, 
+        tools: List[Tool], 
+        cache: Optional[SemanticCache] = None
+    ):
         if not isinstance(llm, ChatGoogleGenerativeAI):
             raise TypeError("llm must be a ChatGoogleGenerativeAI instance")
         if not tools:
@@ -117,63 +511,318 @@ class EfficientResearcher:
         
         self.llm = llm
         self.tools = tools
+        self.cache = cache if cache is not None else SemanticCache()
         
         try:
-            self.agent = initialize_agent(
-                tools=tools,
-                llm=llm,
-                agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                verbose=True,
-                max_iterations=3,  # Reduced from 5
-                handle_parsing_errors=True
-            )
+            self.agent = self._create_agent(self.DEFAULT_MAX_ITERATIONS)
+            self.task_agents = {
+                task_type: self._create_agent(iterations)
+                for task_type, iterations in self.TASK_ITERATIONS.items()
+            }
             logger.info("Research agent initialized")
             
         except Exception as e:
-            logger.error(f"Failed to initialize research agent: {str(e)}")
+            logger.error("Failed to initialize research agent: %s", e)
             raise ResearchError(f"Could not initialize research agent: {str(e)}")
     
-    def execute_task(self, task: ResearchTask, focus_areas: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Execute research with focus area optimization."""
+    def _create_agent(self, max_iterations: int):
+        """Create a ReAct agent bounded by iteration count and wall time."""
+        return initialize_agent(
+            tools=self.tools,
+            llm=self.llm,
+            agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
+            verbose=True,
+            max_iterations=max_iterations,
+            max_execution_time=self.MAX_EXECUTION_TIME,
+            early_stopping_method="generate",  # Summarize instead of "Agent stopped"
+            handle_parsing_errors=True
+        )
+    
+    def _agent_for(self, task: ResearchTask):
+        """Return the agent sized for the task's type."""
+        return self.task_agents.get(task.task_type, self.agent)
+    
+    def execute_task(
+        self, 
+        task: ResearchTask, 
+        focus_areas: Optional[List[str]] = None, 
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """Execute research with focus area optimization.
+
+        With use_cache, a semantically matching result from the last hour is
+        returned without running the agent; pass False to force a refresh.
+        """
         if not isinstance(task, ResearchTask):
             raise TypeError("task must be a ResearchTask instance")
         
-        logger.info(f"Executing task: {task.task_type}")
+        logger.info("Executing task: %s", task.task_type)
         
         try:
             prompt = self._generate_task_prompt(task, focus_areas)
+            direct = not self._needs_tools(task, prompt)
+            cache_namespace = self._cache_namespace(task, focus_areas, direct)
+            
+            if use_cache:
+                cached = self._lookup_cache(cache_namespace, task.description)
+                if cached is not None:
+                    return cached
+            
             start_time = datetime.now()
             
-            results = self.agent.run(prompt)
+            if direct:
+                prompt = self._generate_task_prompt(task, focus_areas, direct=True)
+                results = self.llm.invoke(prompt).content
+            else:
+                results = self._agent_for(task).run(prompt)
             execution_time = (datetime.now() - start_time).total_seconds()
             
-            result_data = {
-                "status": "completed",
-                "content": results,
-                "word_count": len(results.split()),
-                "quality_score": self._assess_quality(results),
-                "execution_time": execution_time
-            }
+            result_data = self._build_result(results, execution_time)
+            self._store_cache(cache_namespace, task.description, result_data)
+            return result_data
+            
+        except Exception as e:
+            logger.error("Task execution failed: %s", e)
+            return self._failed_result(e)
+    
+    async def execute_task_async(
+        self, 
+        task: ResearchTask, 
+        focus_areas: Optional[List[str]] = None, 
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """Async variant of execute_task driving the agent through ainvoke."""
+        if not isinstance(task, ResearchTask):
+            raise TypeError("task must be a ResearchTask instance")
+        
+        logger.info("Executing task: %s", task.task_type)
+        
+        try:
+            prompt = self._generate_task_prompt(task, focus_areas)
+            direct = not self._needs_tools(task, prompt)
+            cache_namespace = self._cache_namespace(task, focus_areas, direct)
+            
+            if use_cache:
+                cached = await asyncio.to_thread(
+                    self._lookup_cache, cache_namespace, task.description
+                )
+                if cached is not None:
+                    return cached
+            
+            start_time = datetime.now()
             
-            logger.info(f"Task completed - Words: {result_data['word_count']}")
+            if direct:
+                prompt = self._generate_task_prompt(task, focus_areas, direct=True)
+                results = (await self.llm.ainvoke(prompt)).content
+            else:
+                response = await self._agent_for(task).ainvoke({"input": prompt})
+                results = response["output"]
+            execution_time = (datetime.now() - start_time).total_seconds()
+            
+            result_data = self._build_result(results, execution_time)
+            await asyncio.to_thread(
+                self._store_cache, cache_namespace, task.description, result_data
+            )
             return result_data
             
         except Exception as e:
-            logger.error(f"Task execution failed: {str(e)}")
-            return {
-                "status": "failed",
-                "error": str(e),
-                "content": "",
-                "word_count": 0,
-                "quality_score": 0.0,
-                "execution_time": 0.0
-            }
+            logger.error("Task execution failed: %s", e)
+            return self._failed_result(e)
     
-    def _generate_task_prompt(self, task: ResearchTask, focus_areas: Optional[List[str]]) -> str:
-        """Generate optimized, focus-based prompts."""
-        current_date = datetime.now().strftime("%B %Y")
+    def execute_plan(
+        self, 
+        tasks: List[ResearchTask], 
+        focus_areas: Optional[List[str]] = None, 
+        use_cache: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute independent research tasks concurrently.
         
-        # Create focused search terms based on focus areas
+        Returns results keyed by task type value, in plan order. Safe to call
+        from a thread that already runs an event loop.
+        """
+        coroutine = self._execute_plan_async(tasks, focus_areas, use_cache)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    
+    async def _execute_plan_async(
+        self, 
+        tasks: List[ResearchTask], 
+        focus_areas: Optional[List[str]], 
+        use_cache: bool
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run all tasks under a concurrency limit and collect their results.
+        
+        Tasks that can be answered without tools skip the ReAct loop and go
+        to the model together in one batch call.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TASKS)
+        direct_tasks = [
+            task for task in tasks
+            if isinstance(task, ResearchTask)
+            and not self._needs_tools(task, self._generate_task_prompt(task, focus_areas))
+        ]
+        direct_ids = set(map(id, direct_tasks))
+        agent_tasks = [task for task in tasks if id(task) not in direct_ids]
+        
+        async def run_bounded(task: ResearchTask) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.execute_task_async(task, focus_areas, use_cache)
+        
+        logger.info(
+            "Executing %s research tasks concurrently (%s without tools)",
+            len(tasks), len(direct_tasks)
+        )
+        results = await asyncio.gather(
+            self._answer_directly_async(direct_tasks, focus_areas, use_cache),
+            *(run_bounded(task) for task in agent_tasks),
+            return_exceptions=True
+        )
+        
+        direct_results = results[0]
+        if isinstance(direct_results, BaseException):
+            direct_results = [self._failed_result(direct_results)] * len(direct_tasks)
+        
+        by_task = dict(zip(map(id, direct_tasks), direct_results))
+        by_task.update(zip(map(id, agent_tasks), results[1:]))
+        
+        return {
+            task.task_type.value: (
+                self._failed_result(by_task[id(task)])
+                if isinstance(by_task[id(task)], BaseException)
+                else by_task[id(task)]
+            )
+            for task in tasks
+        }
+    
+    async def _answer_directly_async(
+        self, 
+        tasks: List[ResearchTask], 
+        focus_areas: Optional[List[str]], 
+        use_cache: bool
+    ) -> List[Dict[str, Any]]:
+        """Answer tool-free tasks with a single batched model call."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        pending = []
+        
+        for index, task in enumerate(tasks):
+            cache_namespace = self._cache_namespace(task, focus_areas, direct=True)
+            
+            if use_cache:
+                cached = await asyncio.to_thread(
+                    self._lookup_cache, cache_namespace, task.description
+                )
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            
+            pending.append((
+                index, task, cache_namespace,
+                self._generate_task_prompt(task, focus_areas, direct=True)
+            ))
+        
+        if pending:
+            start_time = datetime.now()
+            responses = await self.llm.abatch(
+                [prompt for _, _, _, prompt in pending], return_exceptions=True
+            )
+            execution_time = (datetime.now() - start_time).total_seconds()
+            
+            for (index, task, cache_namespace, _), response in zip(pending, responses):
+                if isinstance(response, BaseException):
+                    logger.error("Task execution failed: %s", response)
+                    results[index] = self._failed_result(response)
+                    continue
+                
+                result_data = self._build_result(response.content, execution_time)
+                await asyncio.to_thread(
+                    self._store_cache, cache_namespace, task.description, result_data
+                )
+                results[index] = result_data
+        
+        return results
+    
+    def _needs_tools(self, task: ResearchTask, prompt: str) -> bool:
+        """
+        Decide whether a task needs web tools or can be answered by the model.
+        
+        Only task types in DIRECT_ANSWER_TASKS qualify, and only with a short
+        prompt and a topic that does not ask for recent information.
+        """
+        if task.task_type not in self.DIRECT_ANSWER_TASKS:
+            return True
+        if len(prompt) > self.DIRECT_PROMPT_MAX_CHARS:
+            return True
+        return self._DATE_SENSITIVE_RE.search(task.topic or task.description) is not None
+    
+    def _build_result(self, results: str, execution_time: float) -> Dict[str, Any]:
+        """Build the result record for a completed task."""
+        word_count = len(results.split())
+        
+        result_data = {
+            "status": "completed",
+            "content": results,
+            "word_count": word_count,
+            "quality_score": self._assess_quality(results, word_count=word_count),
+            "execution_time": execution_time
+        }
+        
+        logger.info("Task completed - Words: %s", result_data['word_count'])
+        return result_data
+    
+    def _failed_result(self, error: BaseException) -> Dict[str, Any]:
+        """Build the result record for a failed task."""
+        return {
+            "status": "failed",
+            "error": str(error),
+            "content": "",
+            "word_count": 0,
+            "quality_score": 0.0,
+            "execution_time": 0.0
+        }
+    
+    def _cache_namespace(
+        self, 
+        task: ResearchTask, 
+        focus_areas: Optional[List[str]], 
+        direct: bool = False
+    ) -> str:
+        """
+        Build the exact-match part of a task's cache key.
+        
+        The topic is matched exactly: plan descriptions come from templates
+        that differ only in the topic words, so "Python 3.12" and "Python 3.13"
+        would otherwise be similar enough to share results. Similarity only
+        covers the wording of the description within one topic. Tool-free
+        answers are kept apart from tool-backed research.
+        """
+        topic = " ".join((task.topic or task.description).lower().split())
+        source = "direct" if direct else "tools"
+        return f"{task.task_type.value}|{source}|{topic}|{self._focus_search(focus_areas)}"
+    
+    def _lookup_cache(self, namespace: str, description: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result, treating cache failures as misses."""
+        try:
+            return self.cache.get(namespace, description)
+        except Exception as e:
+            logger.warning("Semantic cache lookup failed: %s", e)
+            return None
+    
+    def _store_cache(self, namespace: str, description: str, result_data: Dict[str, Any]) -> None:
+        """Store a completed result, never failing the task on cache errors."""
+        try:
+            self.cache.put(namespace, description, result_data)
+        except Exception as e:
+            logger.warning("Semantic cache store failed: %s", e)
+    
+    def _focus_search(self, focus_areas: Optional[List[str]]) -> str:
+        """Build the focus search line from the selected focus areas."""
         focus_search = ""
         if focus_areas:
             focus_keywords = []
@@ -192,75 +841,105 @@ class EfficientResearcher:
             if focus_keywords:
                 focus_search = f"Focus on: {', '.join(focus_keywords[:2])}"
         
-        # Streamlined prompts with token optimization
-        prompts = {
-            TaskType.OVERVIEW_RESEARCH: f"""
-Find basic info about: {task.description}
-Date: {current_date}
-{focus_search}
-
-Search for recent info and provide:
-- What it is (simple explanation)
-- Why it matters
-- Current status in 2025
-- Key facts and numbers
-
-Keep it simple and clear. 300-500 words max.
-""",
-            
-            TaskType.CURRENT_TRENDS: f"""
-Find latest news about: {task.description}
-Date: {current_date}
-{focus_search}
-
-Search for 2025 updates and provide:
-- Recent developments
-- New statistics or data
-- Market changes
-- What's happening now
-
-Focus on current year only. 200-400 words max.
-""",
-            
-            TaskType.DETAILED_ANALYSIS: f"""
-Find expert views on: {task.description}
-Date: {current_date}
-{focus_search}
-
-Search for analysis and provide:
-- Expert opinions
-- Real-world examples
-- Benefits and challenges
-- What it means for people
-
-Use simple language. 200-400 words max.
-"""
-        }
+        return focus_search
+    
+    def _generate_task_prompt(
+        self, 
+        task: ResearchTask, 
+        focus_areas: Optional[List[str]], 
+        direct: bool = False
+    ) -> str:
+        """Generate optimized, focus-based prompts.
+        
+        With direct, the tool-free variant for answering without the agent.
+        """
+        _, current_date, _ = get_date_context()
+        
+        # Create focused search terms based on focus areas
+        focus_search = self._focus_search(focus_areas)
+        
+        if direct:
+            preamble = DIRECT_ANSWER_PREAMBLE
+            instructions = _DIRECT_TASK_INSTRUCTIONS.get(task.task_type)
+        else:
+            preamble = SHARED_RESEARCH_PREAMBLE
+            instructions = _TASK_INSTRUCTIONS.get(task.task_type)
+        if instructions is None:
+            return task.description
         
-        return prompts.get(task.task_type, task.description)
+        # Static text first, per-task fields last, so every prompt shares
+        # the longest possible prefix for provider-side prompt caching
+        return (
+            f"{preamble}{instructions}"
+            f"\n---\nTOPIC: {task.description}\nDATE: {current_date}\n{focus_search}"
+        )
     
-    def _assess_quality(self, content: str) -> float:
-        """Simplified quality assessment."""
+    def _assess_quality(
+        self, 
+        content: str, 
+        lowered: Optional[str] = None, 
+        word_count: Optional[int] = None
+    ) -> float:
+        """Simplified quality assessment.
+        
+        Callers that already lowercased or split the content can pass the
+        results in to skip recomputing them.
+        """
         if not content:
             return 0.0
         
         score = 0.0
-        word_count = len(content.split())
+        if word_count is None:
+            word_count = len(content.split())
+        if lowered is None:
+            lowered = content.lower()
         
         if word_count > 100:
             score += 0.4
-        if any(indicator in content.lower() for indicator in ["study", "research", "according to"]):
+        if self._CREDIBILITY_RE.search(lowered):
             score += 0.3
-        if any(char.isdigit() for char in content):
+        if not self._DIGITS.isdisjoint(content):
             score += 0.3
         
         return min(score, 1.0)
+    
+    def assess_quality_batch(self, contents: List[str]) -> np.ndarray:
+        """Score many snippets at once with the same rules as _assess_quality."""
+        features = np.array(
+            [self._quality_features(content) for content in contents], dtype=bool
+        ).reshape(-1, len(self._QUALITY_WEIGHTS))
+        return self.score_batch(features)
+    
+    @classmethod
+    def score_batch(cls, features: np.ndarray) -> np.ndarray:
+        """
+        Vectorized quality scores for an (N, 3) boolean feature matrix.
+        
+        Columns are: more than 100 words, credibility indicator, contains digits.
+        """
+        return np.minimum(features.astype(np.float32) @ cls._QUALITY_WEIGHTS, 1.0)
+    
+    def _quality_features(self, content: str) -> Tuple[bool, bool, bool]:
+        """Extract the boolean features scored by _assess_quality."""
+        if not content:
+            return False, False, False
+        
+        return (
+            len(content.split()) > 100,
+            self._CREDIBILITY_RE.search(content.lower()) is not None,
+            not self._DIGITS.isdisjoint(content),
+        )
 
 
 class QuickAnalyzer:
     """Streamlined analysis engine with focus area integration."""
     
-    MAX_CONTENT_LENGTH = 4000  # Reduced from 8000
+    # Input budgets in estimated tokens (about 4000 and 1000 ASCII characters)
+    MAX_CONTENT_TOKENS = 1000
+    MAX_SECTION_TOKENS = 250
+    MAX_BATCH_CONCURRENCY = 4
+    
+    _WHITESPACE_RE = re.compile(r"\s+")
     
     def __init__(self, llm: ChatGoogleGenerativeAI):
         if not isinstance(llm, ChatGoogleGenerativeAI):
@@ -270,78 +949,130 @@ class QuickAnalyzer:
         self.analysis_chain = self._create_analysis_chain()
         logger.info("Quick analyzer initialized")
     
-    def _create_analysis_chain(self) -> LLMChain:
+    def _create_analysis_chain(self) -> Runnable:
         """Create streamlined analysis chain."""
-        prompt_template = PromptTemplate(
-            input_variables=["research_content", "focus_areas"],
-            template="""
-Analyze this research and extract key points:
-
-{research_content}
-
-Focus areas: {focus_areas}
-
-Provide in simple language:
-1. Top 3 key points
-2. Important numbers or facts
-3. Main trends
-4. What this means for people
-
-Keep it brief and easy to understand.
-"""
-        )
-        
-        return LLMChain(llm=self.llm, prompt=prompt_template)
+        return _ANALYSIS_PROMPT | self.llm | StrOutputParser()
     
     def analyze(self, research_results: Dict[str, Any], focus_areas: Optional[List[str]] = None) -> Dict[str, Any]:
         """Analyze with focus area consideration."""
-        if not research_results:
-            raise ValueError("research_results cannot be empty")
+        inputs = self._build_analysis_inputs(research_results, focus_areas)
         
         logger.info("Starting focused analysis")
         
         try:
-            combined_content = self._combine_research_content(research_results)
-            focus_text = ", ".join(focus_areas[:3]) if focus_areas else "General overview"
+            analysis = self.analysis_chain.invoke(inputs)
+            return self.build_analysis(research_results, analysis, focus_areas)
             
-            analysis = self.analysis_chain.run({
-                "research_content": combined_content,
-                "focus_areas": focus_text
-            })
-            
-            total_words = sum(
-                result.get("word_count", 0)
-                for result in research_results.values()
-                if isinstance(result, dict)
+        except Exception as e:
+            logger.error("Analysis failed: %s", e)
+            raise ResearchError(f"Could not analyze research results: {str(e)}")
+    
+    def analyze_many(
+        self, 
+        research_batches: List[Dict[str, Any]], 
+        focus_areas: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Analyze several research result sets in one batched model call."""
+        if not research_batches:
+            return []
+        
+        inputs = [
+            self._build_analysis_inputs(research_results, focus_areas)
+            for research_results in research_batches
+        ]
+        
+        logger.info("Starting batched analysis of %s result sets", len(inputs))
+        
+        try:
+            analyses = self.analysis_chain.batch(
+                inputs, config={"max_concurrency": self.MAX_BATCH_CONCURRENCY}
             )
-            
-            return {
-                "key_insights": analysis,
-                "total_words": total_words,
-                "focus_areas": focus_areas or [],
-                "successful_tasks": len([
-                    r for r in research_results.values()
-                    if isinstance(r, dict) and r.get("status") == "completed"
-                ])
-            }
+            return [
+                self.build_analysis(research_results, analysis, focus_areas)
+                for research_results, analysis in zip(research_batches, analyses)
+            ]
             
         except Exception as e:
-            logger.error(f"Analysis failed: {str(e)}")
+            logger.error("Batched analysis failed: %s", e)
             raise ResearchError(f"Could not analyze research results: {str(e)}")
     
+    def stream_insights(
+        self, 
+        research_results: Dict[str, Any], 
+        focus_areas: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """Generate the key insights text, yielding it as it arrives.
+        
+        Pass the joined text to build_analysis to get the analyze() result.
+        """
+        inputs = self._build_analysis_inputs(research_results, focus_areas)
+        
+        logger.info("Streaming focused analysis")
+        
+        try:
+            for chunk in self.analysis_chain.stream(inputs):
+                if chunk:
+                    yield chunk
+                    
+        except Exception as e:
+            logger.error("Analysis failed: %s", e)
+            raise ResearchError(f"Could not analyze research results: {str(e)}")
+    
+    def build_analysis(
+        self, 
+        research_results: Dict[str, Any], 
+        key_insights: str, 
+        focus_areas: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Wrap generated key insights with research statistics."""
+        scores = TaskScores.from_results(research_results)
+        
+        return {
+            "key_insights": key_insights,
+            "total_words": scores.total_words,
+            "average_quality": scores.average_quality,
+            "focus_areas": focus_areas or [],
+            "successful_tasks": scores.successful_tasks
+        }
+    
+    def _build_analysis_inputs(
+        self, 
+        research_results: Dict[str, Any], 
+        focus_areas: Optional[List[str]]
+    ) -> Dict[str, str]:
+        """Validate arguments and build the analysis chain inputs."""
+        if not research_results:
+            raise ValueError("research_results cannot be empty")
+        
+        return {
+            "research_content": self._combine_research_content(research_results),
+            "focus_areas": ", ".join(focus_areas[:3]) if focus_areas else "General overview"
+        }
+    
     def _combine_research_content(self, research_results: Dict[str, Any]) -> str:
         """Combine content with token optimization."""
-        combined_content = ""
+        parts: List[str] = []
+        remaining = self.MAX_CONTENT_TOKENS
         
         for task_type, result in research_results.items():
             if isinstance(result, dict) and result.get("content"):
-                content = result["content"][:1000]  # Limit each section
-                combined_content += f"{task_type}: {content}\n\n"
-        
-        if len(combined_content) > self.MAX_CONTENT_LENGTH:
-            combined_content = combined_content[:self.MAX_CONTENT_LENGTH] + "..."
+                content = self._WHITESPACE_RE.sub(" ", result["content"]).strip()
+                content = _truncate_to_tokens(content, self.MAX_SECTION_TOKENS)
+                part = f"{task_type}: {content}\n\n"
+                part_tokens = _estimate_tokens(part)
+                
+                # Truncate at the overall budget, on a sentence boundary if possible
+                if part_tokens > remaining:
+                    part = _truncate_to_tokens(part, remaining)
+                    cut = part.rfind(". ")
+                    parts.append(part[:cut + 1] if cut > 0 else part)
+                    parts.append("...")
+                    break
+                
+                parts.append(part)
+                remaining -= part_tokens
         
-        return combined_content
+        return "".join(parts)
 
 
 class BlogReportGenerator:
@@ -355,46 +1086,9 @@ class BlogReportGenerator:
         self.report_chain = self._create_report_chain()
         logger.info("Blog report generator initialized")
     
-    def _create_report_chain(self) -> LLMChain:
+    def _create_report_chain(self) -> Runnable:
         """Create adaptive report template that responds to content and focus."""
-        prompt_template = PromptTemplate(
-            input_variables=["topic", "research_content", "analysis", "focus_areas"],
-            template="""
-            Write a friendly, easy-to-read article about: {topic}
-
-            Research: {research_content}
-            Key insights: {analysis}
-            Focus areas: {focus_areas}
-
-            Based on the research content and focus areas provided, intelligently organize the information into relevant sections. Let the content guide the structure - create section headings that naturally emerge from what you discovered in the research.
-
-            Structure:
-            # {topic}: What You Need to Know
-
-            ## Introduction
-            Brief, friendly intro explaining what this is about and why it matters.
-
-            [Analyze the research content and focus areas, then create 3-4 meaningful sections with headings that reflect the actual findings. Each section should cover the most important aspects discovered in the research.]
-
-            ## What This Means for You
-            Practical takeaways and real-world impact.
-
-            ## Looking Ahead
-            Simple summary of future trends and what to expect.
-
-            Guidelines:
-            - Let the research content determine the section headings and organization
-            - Use simple words instead of complex terms
-            - Explain technical concepts in everyday language
-            - Include specific facts and numbers when available
-            - Keep paragraphs short and readable
-            - Target 2000-2500 words total
-            - Make it conversational and engaging
-            - Focus on what's most relevant and interesting from your research
-            """
-        )
-            
-        return LLMChain(llm=self.llm, prompt=prompt_template)
+        return _REPORT_PROMPT | self.llm | StrOutputParser()
 
     
     def generate_blog_report(
@@ -405,45 +1099,79 @@ class BlogReportGenerator:
         focus_areas: Optional[List[str]] = None
     ) -> str:
         """Generate focus-driven, user-friendly report."""
-        if not topic or not topic.strip():
-            raise ValueError("topic cannot be empty")
-        if not research_results:
-            raise ValueError("research_results cannot be empty")
-        if not analysis:
-            raise ValueError("analysis cannot be empty")
+        inputs = self._build_report_inputs(topic, research_results, analysis, focus_areas)
         
-        logger.info(f"Generating focused report for: {topic}")
+        logger.info("Generating focused report for: %s", topic)
         
         try:
-            research_summary = self._prepare_research_summary(research_results)
-            focus_text = ", ".join(focus_areas[:4]) if focus_areas else "General overview"
-            
-            report = self.report_chain.run({
-                "topic": topic.strip(),
-                "research_content": research_summary,
-                "analysis": analysis.get("key_insights", ""),
-                "focus_areas": focus_text
-            })
+            report = self.report_chain.invoke(inputs)
             
-            logger.info(f"User-friendly report generated - {len(report.split())} words")
+            logger.info("User-friendly report generated - %s words", len(report.split()))
             return report
             
         except Exception as e:
-            logger.error(f"Report generation failed: {str(e)}")
+            logger.error("Report generation failed: %s", e)
             raise ResearchError(f"Could not generate blog report: {str(e)}")
     
+    def stream_blog_report(
+        self, 
+        topic: str, 
+        research_results: Dict[str, Any], 
+        analysis: Dict[str, Any], 
+        focus_areas: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """Generate the same report as generate_blog_report, yielding text as it arrives."""
+        inputs = self._build_report_inputs(topic, research_results, analysis, focus_areas)
+        
+        logger.info("Streaming focused report for: %s", topic)
+        
+        try:
+            for chunk in self.report_chain.stream(inputs):
+                if chunk:
+                    yield chunk
+                    
+        except Exception as e:
+            logger.error("Report streaming failed: %s", e)
+            raise ResearchError(f"Could not generate blog report: {str(e)}")
+    
+    def _build_report_inputs(
+        self, 
+        topic: str, 
+        research_results: Dict[str, Any], 
+        analysis: Dict[str, Any], 
+        focus_areas: Optional[List[str]]
+    ) -> Dict[str, str]:
+        """Validate arguments and build the report chain inputs."""
+        if not topic or not topic.strip():
+            raise ValueError("topic cannot be empty")
+        if not research_results:
+            raise ValueError("research_results cannot be empty")
+        if not analysis:
+            raise ValueError("analysis cannot be empty")
+        
+        research_summary = self._prepare_research_summary(research_results)
+        focus_text = ", ".join(focus_areas[:4]) if focus_areas else "General overview"
+        
+        return {
+            "topic": topic.strip(),
+            "research_content": research_summary,
+            "analysis": analysis.get("key_insights", ""),
+            "focus_areas": focus_text
+        }
+    
     def _prepare_research_summary(self, research_results: Dict[str, Any]) -> str:
         """Prepare concise research summary."""
-        research_summary = ""
-        max_content_per_task = 800  # Reduced from 2000
+        parts: List[str] = []
+        max_tokens_per_task = 200  # About 800 ASCII characters
         
         for task_type, result in research_results.items():
             if isinstance(result, dict) and result.get("content"):
                 content = result["content"]
+                truncated = _truncate_to_tokens(content, max_tokens_per_task)
                 
-                if len(content) > max_content_per_task:
-                    content = content[:max_content_per_task] + "..."
+                if len(truncated) < len(content):
+                    content = truncated + "..."
                 
-                research_summary += f"{task_type.replace('_', ' ')}: {content}\n\n"
+                parts.append(f"{task_type.replace('_', ' ')}: {content}\n\n")
         
-        return research_summary
+        return "".join(parts)
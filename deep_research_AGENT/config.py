@@ -8,15 +8,21 @@ License: MIT
 
 import logging
 import os
+import time
 from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[logging.FileHandler("research_agent.log"), logging.StreamHandler()],
+    force=True,
 )
 logger = logging.getLogger(__name__)
 
@@ -67,7 +73,24 @@ def load_environment_variables() -> None:
     logger.info("Environment variables loaded successfully")
 
 
-def get_llm(temperature: float = 0.3, max_tokens: int = 5000) -> ChatGoogleGenerativeAI:
+@lru_cache(maxsize=1)
+def _current_date_context(minute_epoch: int) -> Tuple[str, str, int]:
+    """Format the date once per minute; the argument is only the cache key."""
+    now = datetime.fromtimestamp(minute_epoch * 60)
+    return now.strftime("%B %d, %Y"), now.strftime("%B %Y"), now.year
+
+
+def get_date_context() -> Tuple[str, str, int]:
+    """
+    Get the current date in the formats used by prompts.
+
+    Returns:
+        Tuple of (full date, month and year, year)
+    """
+    return _current_date_context(int(time.time()) // 60)
+
+
+def get_llm(temperature: float = 0.3, max_tokens: int = 5000) -> "ChatGoogleGenerativeAI":
     """
     Initialize and configure the Gemini language model.
 
@@ -75,19 +98,34 @@ def get_llm(temperature: float = 0.3, max_tokens: int = 5000) -> ChatGoogleGener
         temperature: Model temperature for creativity control
         max_tokens: Maximum tokens for model output
 
+    Instances are shared per (temperature, max_tokens) for the current day
+    and API key, so every agent reuses one client and its connections.
+
     Returns:
         Configured ChatGoogleGenerativeAI instance
 
     Raises:
         ConfigurationError: If model initialization fails
     """
-    current_date = datetime.now().strftime("%B %d, %Y")
+    current_date, _, _ = get_date_context()
+    return _build_llm(
+        temperature, max_tokens, current_date, os.getenv("GOOGLE_API_KEY")
+    )
+
 
+@lru_cache(maxsize=4)
+def _build_llm(
+    temperature: float, max_tokens: int, current_date: str, api_key: Optional[str]
+) -> "ChatGoogleGenerativeAI":
+    """Build a Gemini model whose system instruction carries current_date."""
     try:
+        # Imported here so loading the config never pulls in the Gemini SDK
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         llm = ChatGoogleGenerativeAI(
             model="gemini-2.5-flash-lite-preview-06-17",
             temperature=temperature,
-            google_api_key=os.getenv("GOOGLE_API_KEY"),
+            google_api_key=api_key,
             max_output_tokens=max_tokens,
             verbose=False,
             model_kwargs={
@@ -103,5 +141,5 @@ def get_llm(temperature: float = 0.3, max_tokens: int = 5000) -> ChatGoogleGener
         return llm
 
     except Exception as e:
-        logger.error(f"Failed to initialize language model: {str(e)}")
+        logger.error("Failed to initialize language model: %s", e)
         raise ConfigurationError(f"Could not initialize language model: {str(e)}")
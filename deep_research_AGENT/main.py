@@ -20,12 +20,14 @@ from config import (
     ResearchError,
     APIError,
 )
+from models import CompactMemory
 from agents import (
     SmartPlanner,
     EfficientResearcher,
     QuickAnalyzer,
     BlogReportGenerator,
     WebsiteSearchTool,
+    WebsiteBatchSearchTool,
 )
 
 logger = logging.getLogger(__name__)
@@ -53,11 +55,15 @@ class StreamlinedCoordinator:
         self.llm = llm
 
         try:
+            # Memory shared by the planner and tools, so pages visited by one
+            # research task are not fetched again by the others
+            self.memory = CompactMemory()
+
             # Initialize tools
             self.tools = self._initialize_tools()
 
             # Initialize agents and components
-            self.planner = SmartPlanner(llm)
+            self.planner = SmartPlanner(llm, memory=self.memory)
             self.researcher = EfficientResearcher(llm, self.tools)
             self.analyzer = QuickAnalyzer(llm)
             self.reporter = BlogReportGenerator(llm)
@@ -65,7 +71,7 @@ class StreamlinedCoordinator:
             logger.info("Streamlined coordinator initialized successfully")
 
         except Exception as e:
-            logger.error(f"Failed to initialize coordinator: {str(e)}")
+            logger.error("Failed to initialize coordinator: %s", e)
             raise ResearchError(f"Could not initialize coordinator: {str(e)}")
 
     def _initialize_tools(self) -> List[Tool]:
@@ -87,14 +93,15 @@ class StreamlinedCoordinator:
                     func=serper_search.run,
                     description="Search Google for current information and comprehensive results.",
                 ),
-                WebsiteSearchTool(),
+                WebsiteSearchTool(memory=self.memory),
+                WebsiteBatchSearchTool(memory=self.memory),
             ]
 
-            logger.info(f"Initialized {len(tools)} research tools")
+            logger.info("Initialized %s research tools", len(tools))
             return tools
 
         except Exception as e:
-            logger.error(f"Tool initialization failed: {str(e)}")
+            logger.error("Tool initialization failed: %s", e)
             raise APIError(f"Could not initialize research tools: {str(e)}")
 
     def conduct_research(
@@ -117,7 +124,7 @@ class StreamlinedCoordinator:
             raise ValueError("Research topic cannot be empty")
 
         topic = topic.strip()
-        logger.info(f"Starting comprehensive research on: {topic}")
+        logger.info("Starting comprehensive research on: %s", topic)
 
         start_time = datetime.now()
 
@@ -128,22 +135,20 @@ class StreamlinedCoordinator:
 
             # Step 2: Execute research tasks
             logger.info("Executing research tasks...")
-            research_results = {}
-
-            for i, task in enumerate(tasks, 1):
-                logger.info(f"Task {i}/{len(tasks)}: {task.task_type}")
+            research_results = self.researcher.execute_plan(tasks, focus_areas)
 
-                result = self.researcher.execute_task(task, focus_areas)
-                research_results[task.task_type.value] = result
+            for i, (task_type, result) in enumerate(research_results.items(), 1):
+                logger.info("Task %s/%s: %s", i, len(tasks), task_type)
 
                 if result["status"] == "completed":
                     logger.info(
-                        f"Task completed - {result['word_count']} words, "
-                        f"Quality: {result['quality_score']:.2f}"
+                        "Task completed - %s words, Quality: %.2f",
+                        result["word_count"],
+                        result["quality_score"],
                     )
                 else:
                     logger.warning(
-                        f"Task failed: {result.get('error', 'Unknown error')}"
+                        "Task failed: %s", result.get("error", "Unknown error")
                     )
 
             # Step 3: Analyze findings
@@ -158,13 +163,13 @@ class StreamlinedCoordinator:
 
             # Log completion metrics
             completion_time = (datetime.now() - start_time).total_seconds()
-            logger.info(f"Research completed in {completion_time:.1f} seconds")
-            logger.info(f"Generated report: {len(final_report.split())} words")
+            logger.info("Research completed in %.1f seconds", completion_time)
+            logger.info("Generated report: %s words", len(final_report.split()))
 
             return final_report
 
         except Exception as e:
-            logger.error(f"Research process failed: {str(e)}")
+            logger.error("Research process failed: %s", e)
             raise ResearchError(f"Could not complete research: {str(e)}")
 
 
@@ -220,7 +225,7 @@ def main() -> None:
         print("Please try a different topic or check your internet connection")
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         print(f"\nUnexpected Error: {e}")
         print("Please check the logs for more details")
 
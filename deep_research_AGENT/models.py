@@ -6,11 +6,20 @@ Date: July 2025
 License: MIT
 """
 
+import hashlib
+import json
 import logging
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -37,12 +46,14 @@ class ResearchTask:
         description: Human-readable description of the task
         max_tokens: Maximum tokens to use for this task
         results: Task execution results (populated after execution)
+        topic: Original research topic the task was planned for
     """
 
     task_type: TaskType
     description: str
     max_tokens: int
     results: Optional[Dict[str, Any]] = field(default=None)
+    topic: str = ""
 
     def __post_init__(self):
         """Validate task configuration after initialization."""
@@ -70,6 +81,67 @@ class ResearchMetrics:
     successful_tasks: int
 
 
+@dataclass
+class TaskScores:
+    """
+    Per-task research statistics stored as parallel NumPy arrays.
+
+    Attributes:
+        task_types: Task type value for each entry
+        word_counts: Words produced by each task
+        quality_scores: Quality score (0.0 to 1.0) of each task
+        completed: Whether each task completed successfully
+    """
+
+    task_types: List[str]
+    word_counts: np.ndarray
+    quality_scores: np.ndarray
+    completed: np.ndarray
+
+    @classmethod
+    def from_results(cls, research_results: Dict[str, Any]) -> "TaskScores":
+        """Build arrays from research results keyed by task type."""
+        entries = [
+            (task_type, result)
+            for task_type, result in research_results.items()
+            if isinstance(result, dict)
+        ]
+
+        return cls(
+            task_types=[task_type for task_type, _ in entries],
+            word_counts=np.fromiter(
+                (result.get("word_count", 0) for _, result in entries),
+                dtype=np.int32,
+                count=len(entries),
+            ),
+            quality_scores=np.fromiter(
+                (result.get("quality_score", 0.0) for _, result in entries),
+                dtype=np.float32,
+                count=len(entries),
+            ),
+            completed=np.fromiter(
+                (result.get("status") == "completed" for _, result in entries),
+                dtype=bool,
+                count=len(entries),
+            ),
+        )
+
+    @property
+    def total_words(self) -> int:
+        """Total words across all tasks."""
+        return int(self.word_counts.sum())
+
+    @property
+    def average_quality(self) -> float:
+        """Mean quality score, or 0.0 when there are no tasks."""
+        return float(self.quality_scores.mean()) if self.quality_scores.size else 0.0
+
+    @property
+    def successful_tasks(self) -> int:
+        """Number of tasks that completed."""
+        return int(self.completed.sum())
+
+
 class CompactMemory:
     """
     Lightweight memory system for storing research patterns and quality metrics.
@@ -79,13 +151,64 @@ class CompactMemory:
     """
 
     MAX_ENTRIES = 20
+    MAX_PAGE_SUMMARIES = 200
+    PAGE_SUMMARY_TTL_SECONDS = 3600  # Same freshness as WebPageCache
 
     def __init__(self):
         """Initialize empty memory collections."""
         self.successful_queries: List[Dict[str, Any]] = []
         self.source_quality: Dict[str, List[float]] = {}
+        self.page_summaries: Dict[str, Tuple[float, str]] = {}
+        self._page_lock = threading.Lock()
         logger.debug("Memory system initialized")
 
+    @staticmethod
+    def _page_key(url: str) -> str:
+        """Short hash of the normalized URL."""
+        normalized = WebPageCache.normalize_url(url)
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+    def remember_page(self, url: str, summary: str) -> None:
+        """
+        Store the extracted text of a visited page.
+
+        Args:
+            url: Page URL
+            summary: Extracted page text
+        """
+        key = self._page_key(url)
+
+        with self._page_lock:
+            self.page_summaries.pop(key, None)
+            self.page_summaries[key] = (time.time(), summary)
+
+            # Maintain rolling cache (dicts keep insertion order)
+            while len(self.page_summaries) > self.MAX_PAGE_SUMMARIES:
+                del self.page_summaries[next(iter(self.page_summaries))]
+
+    def get_page_summary(self, url: str) -> Optional[str]:
+        """
+        Return the stored text of an already visited page.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            The stored text, or None if the page was not visited within
+            the TTL
+        """
+        key = self._page_key(url)
+
+        with self._page_lock:
+            entry = self.page_summaries.get(key)
+            if entry is None:
+                return None
+            fetched_at, summary = entry
+            if time.time() - fetched_at > self.PAGE_SUMMARY_TTL_SECONDS:
+                del self.page_summaries[key]
+                return None
+            return summary
+
     def remember_success(self, query_type: str, approach: str) -> None:
         """
         Store a successful research approach.
@@ -110,7 +233,7 @@ class CompactMemory:
         if len(self.successful_queries) > self.MAX_ENTRIES:
             self.successful_queries = self.successful_queries[-self.MAX_ENTRIES :]
 
-        logger.debug(f"Stored successful approach for {query_type}")
+        logger.debug("Stored successful approach for %s", query_type)
 
     def get_success_patterns(self, query_type: str) -> List[Dict[str, Any]]:
         """
@@ -125,3 +248,218 @@ class CompactMemory:
         return [
             entry for entry in self.successful_queries if entry["type"] == query_type
         ]
+
+
+class SemanticCache:
+    """
+    Persistent semantic cache for research task results.
+
+    Entries are grouped by namespace (task type, normalized topic and focus
+    keywords must match exactly) and looked up by cosine similarity of the
+    task description, so a reworded task on the same topic reuses a result
+    from the last hour instead of running the research agent again.
+    Embeddings are computed locally.
+    """
+
+    DEFAULT_DB_PATH = "research_cache.db"
+    MODEL_NAME = "all-MiniLM-L6-v2"
+    SIMILARITY_THRESHOLD = 0.92
+    TTL_SECONDS = 3600
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        threshold: float = SIMILARITY_THRESHOLD,
+        ttl_seconds: int = TTL_SECONDS,
+    ):
+        """Open (or create) the cache database."""
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._model = None
+        self._embed = lru_cache(maxsize=64)(self._encode)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS task_cache (
+                namespace TEXT NOT NULL,
+                text TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                result TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_task_cache_ns ON task_cache (namespace, created)"
+        )
+        self._conn.commit()
+        logger.debug("Semantic cache opened at %s", db_path)
+
+    def _encode(self, text: str) -> np.ndarray:
+        """Embed text as a normalized float32 vector."""
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                self._model = SentenceTransformer(self.MODEL_NAME)
+
+        embedding = self._model.encode(
+            [text], show_progress_bar=False, normalize_embeddings=True
+        )
+        return np.asarray(embedding[0], dtype=np.float32)
+
+    def get(self, namespace: str, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result most similar to text, if any is close enough.
+
+        Args:
+            namespace: Exact-match partition key
+            text: Text compared semantically against cached entries
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        cutoff = time.time() - self.ttl_seconds
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT text, embedding, result FROM task_cache "
+                "WHERE namespace = ? AND created >= ?",
+                (namespace, cutoff),
+            ).fetchall()
+
+        if not rows:
+            return None
+
+        for cached_text, _, result in rows:
+            if cached_text == text:
+                logger.info("Semantic cache exact hit for %s", namespace)
+                return json.loads(result)
+
+        matrix = np.vstack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+        similarities = matrix @ self._embed(text)
+        best = int(np.argmax(similarities))
+
+        if similarities[best] < self.threshold:
+            return None
+
+        logger.info(
+            "Semantic cache hit for %s (similarity %.3f)", namespace, similarities[best]
+        )
+        return json.loads(rows[best][2])
+
+    def put(self, namespace: str, text: str, result: Dict[str, Any]) -> None:
+        """
+        Store a result and drop entries older than the TTL.
+
+        Args:
+            namespace: Exact-match partition key
+            text: Text the result is looked up by
+            result: JSON-serializable result to cache
+        """
+        embedding = self._embed(text)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM task_cache WHERE created < ?", (now - self.ttl_seconds,)
+            )
+            self._conn.execute(
+                "INSERT INTO task_cache (namespace, text, embedding, result, created) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (namespace, text, embedding.tobytes(), json.dumps(result), now),
+            )
+            self._conn.commit()
+
+        logger.debug("Cached result for %s", namespace)
+
+
+class WebPageCache:
+    """
+    Disk-backed LRU cache of extracted page text keyed by normalized URL.
+
+    Lets the research tasks of a plan (and later plans within the TTL)
+    reuse pages instead of fetching and parsing them again.
+    """
+
+    DEFAULT_DB_PATH = "web_cache.db"
+    TTL_SECONDS = 3600
+    MAX_ENTRIES = 2000
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        ttl_seconds: int = TTL_SECONDS,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        """Open (or create) the cache database."""
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_cache (
+                url TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        logger.debug("Web page cache opened at %s", db_path)
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Drop the fragment, lowercase scheme and host, and sort query parameters."""
+        parts = urlsplit(url.strip())
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit(
+            (parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, "")
+        )
+
+    def get(self, url: str) -> Optional[str]:
+        """Return cached page text for url, or None on a miss."""
+        key = self.normalize_url(url)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM page_cache WHERE url = ? AND created >= ?",
+                (key, now - self.ttl_seconds),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE page_cache SET accessed = ? WHERE url = ?", (now, key)
+            )
+            self._conn.commit()
+
+        logger.debug("Web page cache hit for %s", key)
+        return row[0]
+
+    def set(self, url: str, content: str) -> None:
+        """Store page text for url, evicting expired and least recently used entries."""
+        key = self.normalize_url(url)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_cache (url, content, created, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, content, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM page_cache WHERE created < ?", (now - self.ttl_seconds,)
+            )
+            self._conn.execute(
+                "DELETE FROM page_cache WHERE url IN ("
+                "SELECT url FROM page_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
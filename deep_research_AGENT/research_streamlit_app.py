@@ -9,23 +9,34 @@ Date: July 2025
 License: MIT
 """
 
+import hashlib
+import html
 import os
+import re
 import time
 from datetime import datetime
-from typing import Dict, Any, Tuple, List
-import re
-import markdown
+from typing import TYPE_CHECKING, Dict, Any, Tuple, List, Optional
+from functools import lru_cache
+from urllib.parse import quote_plus
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import orjson
 import streamlit as st
+from cachetools import TTLCache
 
-# Import the research system
+# Import the research system; the agent stack itself is imported lazily so
+# the input form renders without waiting on LangChain and the model SDKs
 from config import (
     load_environment_variables,
+    get_date_context,
     get_llm,
     ConfigurationError,
     ResearchError,
 )
-from main import StreamlinedCoordinator
+
+if TYPE_CHECKING:
+    from main import StreamlinedCoordinator
 
 # ================================================================
 # STREAMLIT CONFIGURATION
@@ -42,414 +53,207 @@ st.set_page_config(
 # PROFESSIONAL CSS STYLING
 # ================================================================
 
-st.markdown(
+_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "app.css")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _minify_css(css: str) -> str:
     """
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    .stApp {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        background-color: #0e1117;
-        color: #ffffff;
-    }
-    
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }
-    
-    .main-header {
-        text-align: center;
-        color: #ffffff !important;
-        font-size: 2.8rem;
-        margin-bottom: 0.5rem;
-        font-weight: 700;
-        letter-spacing: -0.02em;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .subtitle {
-        text-align: center;
-        color: #a0aec0 !important;
-        font-size: 1.2rem;
-        margin-bottom: 3rem;
-        font-weight: 400;
-    }
-    
-    .section-header {
-        color: #e2e8f0 !important;
-        font-size: 1.3rem;
-        margin-top: 2.5rem;
-        margin-bottom: 1.5rem;
-        font-weight: 600;
-        position: relative;
-    }
-    
-    .section-header::after {
-        content: '';
-        position: absolute;
-        bottom: -8px;
-        left: 0;
-        width: 60px;
-        height: 3px;
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        border-radius: 2px;
-    }
-    
-    .research-input-card {
-        background: rgba(255, 255, 255, 0.05) !important;
-        backdrop-filter: blur(10px);
-        padding: 2.0rem;
-        border-radius: 20px;
-        margin: 2rem 0;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .research-input-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 6px;
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    .research-input-header {
-        color: #ffffff !important;
-        font-size: 1.3rem;
-        margin-bottom: 1.5rem;
-        font-weight: 600;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        color: white !important;
-        border: none !important;
-        padding: 0 2rem !important;
-        border-radius: 12px !important;
-        font-weight: 600 !important;
-        font-size: 0.95rem !important;
-        cursor: pointer !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 4px 20px rgba(102, 126, 234, 0.4) !important;
-        height: 50px !important;
-        min-width: 140px !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        margin: 0 !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 6px 25px rgba(102, 126, 234, 0.5) !important;
-        background: linear-gradient(135deg, #5a67d8 0%, #6b46c1 100%) !important;
-    }
-    
-    .stTextInput > div > div > input {
-        height: 40px !important;
-        border: 2px solid rgba(255, 255, 255, 0.2) !important;
-        border-radius: 10px !important;
-        font-size: 1rem !important;
-        padding: 0 1.5rem !important;
-        transition: all 0.3s ease !important;
-        background-color: rgba(255, 255, 255, 0.05) !important;
-        color: #ffffff !important;
-        backdrop-filter: blur(10px);
-    }
-    
-    .stTextInput > div > div > input::placeholder {
-        color: #a0aec0 !important;
-        opacity: 0.7;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #667eea !important;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.2) !important;
-        background-color: rgba(255, 255, 255, 0.1) !important;
-    }
-    
-    .stForm {
-        background: transparent !important;
-        border: none !important;
-    }
-    
-    div[data-testid="column"]:has(.stButton) {
-        display: flex !important;
-        align-items: flex-end !important;
-        justify-content: center !important;
-        padding-bottom: 0 !important;
-        margin-bottom: 0 !important;
-    }
-    
-    /* Topic links styling */
-    .topic-link {
-        color: #667eea !important;
-        text-decoration: none !important;
-        font-size: 0.95rem !important;
-        font-weight: 500 !important;
-        padding: 0.75rem 1rem !important;
-        margin: 0.5rem 0 !important;
-        border-radius: 8px !important;
-        transition: all 0.3s ease !important;
-        background: rgba(255, 255, 255, 0.03) !important;
-        border: 1px solid rgba(102, 126, 234, 0.2) !important;
-        display: block !important;
-        cursor: pointer !important;
-    }
-    
-    .topic-link:hover {
-        color: #ffffff !important;
-        background: rgba(102, 126, 234, 0.15) !important;
-        border-color: rgba(102, 126, 234, 0.4) !important;
-        transform: translateX(4px) !important;
-        text-decoration: none !important;
-    }
-    
-    .sidebar-section {
-        background: rgba(255, 255, 255, 0.05) !important;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-    }
-    
-    .task-progress-minimal {
-        margin: 2rem 0;
-        padding: 1.5rem;
-        background: rgba(255, 255, 255, 0.05);
-        border-radius: 12px;
-        backdrop-filter: blur(10px);
-    }
-    
-    .progress-text {
-        color: #e2e8f0 !important;
-        font-size: 1rem;
-        font-weight: 500;
-        margin-bottom: 1rem;
-        text-align: center;
-    }
-    
-    .stProgress > div {
-        background: rgba(255, 255, 255, 0.1) !important;
-        border-radius: 10px !important;
-        height: 8px !important;
-    }
-    
-    .stProgress > div > div {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%) !important;
-        border-radius: 10px !important;
-    }
-    
-    .blog-content {
-        background: rgba(255, 255, 255, 0.05) !important;
-        color: #e2e8f0 !important;
-        padding: 3rem;
-        border-radius: 20px;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-        line-height: 1.8;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(10px);
-        margin: 2rem 0 3rem 0;
-    }
-    
-    .blog-content h1 {
-        color: #ffffff !important;
-        border-bottom: 3px solid #667eea;
-        padding-bottom: 1rem;
-        margin-bottom: 2rem;
-        font-weight: 700;
-        font-size: 2.25rem;
-    }
-    
-    .blog-content h2 {
-        color: #f7fafc !important;
-        margin-top: 2.5rem;
-        margin-bottom: 1.25rem;
-        font-weight: 600;
-        font-size: 1.6rem;
-    }
-    
-    .blog-content h3 {
-        color: #e2e8f0 !important;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-        font-weight: 600;
-        font-size: 1.3rem;
-    }
-    
-    .blog-content p {
-        color: #cbd5e0 !important;
-        margin-bottom: 1.5rem;
-        font-size: 1.05rem;
-        line-height: 1.7;
-    }
-    
-    .blog-content li {
-        color: #cbd5e0 !important;
-        margin-bottom: 0.75rem;
-        line-height: 1.6;
-    }
-    
-    .blog-content strong {
-        color: #ffffff !important;
-        font-weight: 600;
-    }
-    
-    .success-alert {
-        background: linear-gradient(135deg, #48bb78 0%, #38a169 100%) !important;
-        color: white !important;
-        padding: 1.25rem;
-        border-radius: 12px;
-        margin: 1.5rem 0;
-        font-weight: 500;
-        box-shadow: 0 4px 20px rgba(72, 187, 120, 0.3);
-    }
-    
-    /* Action buttons container */
-    .action-buttons {
-        margin-top: 2.5rem !important;
-        padding-top: 2rem !important;
-        border-top: 1px solid rgba(255, 255, 255, 0.1) !important;
-    }
-    
-    /* Download button styling */
-    .stDownloadButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        color: white !important;
-        border: none !important;
-        padding: 0 2rem !important;
-        border-radius: 12px !important;
-        font-weight: 600 !important;
-        font-size: 0.95rem !important;
-        cursor: pointer !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 4px 20px rgba(102, 126, 234, 0.4) !important;
-        height: 50px !important;
-        min-width: 140px !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        margin: 0 !important;
-    }
-    
-    .stDownloadButton > button:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 6px 25px rgba(102, 126, 234, 0.5) !important;
-        background: linear-gradient(135deg, #5a67d8 0%, #6b46c1 100%) !important;
-    }
-    
-    .stMultiSelect [data-baseweb="tag"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        border: none !important;
-        border-radius: 8px !important;
-        color: white !important;
-    }
-    
-    .stMultiSelect [data-baseweb="tag"]:hover {
-        background: linear-gradient(135deg, #5a67d8 0%, #6b46c1 100%) !important;
-    }
-    
-    .stSelectbox > div > div {
-        background-color: rgba(255, 255, 255, 0.05) !important;
-        border-color: rgba(255, 255, 255, 0.2) !important;
-        color: #ffffff !important;
-    }
-    
-    .stMarkdown, .stText {
-        color: #e2e8f0 !important;
-    }
-    
-    .css-1d391kg .stMarkdown {
-        color: #e2e8f0 !important;
-    }
-    
-    /* Updated topic links styling for vertical list */
-.stButton[data-testid="baseButton-secondary"] > button {
-    background: transparent !important;
-    color: #667eea !important;
-    border: none !important;
-    padding: 1rem 0 !important;
-    border-radius: 0 !important;
-    font-weight: 400 !important;
-    font-size: 1rem !important;
-    text-align: left !important;
-    width: 100% !important;
-    height: auto !important;
-    min-height: auto !important;
-    line-height: 1.5 !important;
-    transition: all 0.2s ease !important;
-    border-bottom: 1px solid rgba(102, 126, 234, 0.1) !important;
-    box-shadow: none !important;
-    transform: none !important;
-}
-
-.stButton[data-testid="baseButton-secondary"] > button:hover {
-    color: #ffffff !important;
-    background: rgba(102, 126, 234, 0.1) !important;
-    border-bottom-color: rgba(102, 126, 234, 0.3) !important;
-    transform: none !important;
-    box-shadow: none !important;
-    padding-left: 1rem !important;
-}
-
-/* Hide the secondary button styling for topic links */
-div[data-testid="baseButton-secondary"] {
-    width: 100% !important;
-    margin-bottom: 0.5rem !important;
-}
-
-
-</style>
-""",
-    unsafe_allow_html=True,
-)
+    Drop comments and redundant whitespace from a stylesheet.
+
+    Whitespace before ':' is kept, since in a selector it separates a
+    descendant from a pseudo-class.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCTUATION_RE.sub(r"\1", css)
+    css = css.replace(": ", ":").replace(";}", "}")
+    return css.strip()
+
+
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    """
+    Read the stylesheet once per server process.
+
+    The result is emitted with st.html rather than st.markdown, so a rerun
+    only re-sends a style element instead of re-parsing it as markdown.
+    """
+    with open(_CSS_PATH, encoding="utf-8") as css_file:
+        return f"<style>{_minify_css(css_file.read())}</style>"
+
+
+st.html(_load_css())
 
 # ================================================================
 # UTILITY FUNCTIONS
 # ================================================================
 
-def format_blog_content(content: str) -> str:
+_EMPTY_CONTENT_HTML = "<p>No content available.</p>"
+
+@st.cache_resource(show_spinner=False)
+def _get_markdown_converter():
     """
-    Convert markdown content to HTML using the markdown library.
-    
-    Args:
-        content: Raw markdown content string
-        
-    Returns:
-        Formatted HTML content string
+    Build the shared markdown converter on first use.
+
+    The converter is created once per server process (the landing page never
+    imports markdown) and is paired with a lock, since a converter instance
+    is stateful and shared between sessions.
     """
-    if not content:
-        return "<p>No content available.</p>"
-    
+    import markdown
+
     # Configure markdown with extensions for better formatting
-    md = markdown.Markdown(
+    converter = markdown.Markdown(
         extensions=[
             'extra',          # Tables, fenced code blocks, etc.
             'codehilite',     # Syntax highlighting
-            'toc',            # Table of contents
             'nl2br',          # Convert newlines to <br>
             'sane_lists'      # Better list handling
         ]
     )
+    return converter, threading.Lock()
+
+
+_FENCE_RE = re.compile(r"^\s*(?:```|~~~)")
+_LIST_OR_INDENT_RE = re.compile(r"^(?:\s+\S|[-*+]\s|\d+[.)]\s)")
+
+
+def _split_blocks(content: str) -> List[str]:
+    """
+    Split markdown into blocks that can be converted independently.
+
+    Blocks are separated by blank lines, except inside fenced code, and a
+    list or indented block stays attached to the block it continues so
+    numbering and nesting survive the split.
+    """
+    # Blocks are kept as line lists and joined once at the end, so merging a
+    # long run of list items never re-copies the text gathered so far
+    blocks: List[List[str]] = []
+    current: List[str] = []
+    in_fence = False
+
+    def flush() -> None:
+        if (
+            blocks
+            and _LIST_OR_INDENT_RE.match(current[0])
+            and _LIST_OR_INDENT_RE.match(blocks[-1][-1])
+        ):
+            blocks[-1].append("")
+            blocks[-1].extend(current)
+        else:
+            blocks.append(current.copy())
+        current.clear()
+
+    for line in content.split("\n"):
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        if in_fence or line.strip():
+            current.append(line)
+        elif current:
+            flush()
+
+    if current:
+        flush()
+
+    return ["\n".join(lines) for lines in blocks]
+
+
+_HEADER_LEVELS = {"#": 1, "##": 2, "###": 3}
+_INLINE_MARKUP_CHARS = frozenset("*_`[]<>&\\!~#")
+
+
+def _plain_header_html(block: str) -> Optional[str]:
+    """
+    Render a one-line header without inline markup directly.
+
+    Returns None for anything else, which goes through the markdown converter.
+    """
+    if "\n" in block:
+        return None
+    head, _, rest = block.strip().partition(" ")
+    level = _HEADER_LEVELS.get(head)
+    rest = rest.strip()
+    if level is None or not rest or not _INLINE_MARKUP_CHARS.isdisjoint(rest):
+        return None
+    return f"<h{level}>{html.escape(rest, quote=False)}</h{level}>"
+
+
+@st.cache_resource(show_spinner=False)
+def _get_block_formatter():
+    """
+    Build the per-block HTML memo once per server process.
+
+    Wrapping the lru_cache in a resource keeps it alive across script
+    reruns, so only blocks that changed since the last render are converted.
+    """
+    converter, lock = _get_markdown_converter()
+
+    @lru_cache(maxsize=4096)
+    def format_block(block: str) -> str:
+        header = _plain_header_html(block)
+        if header is not None:
+            return header
+        with lock:
+            return converter.reset().convert(block)
+
+    return format_block
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def format_blog_content(content: str) -> str:
+    """
+    Convert markdown content to HTML using the markdown library.
+
+    Cached by content, so reruns of the report page reuse the HTML, and
+    converted block by block so a report whose tail changed only pays for
+    the changed blocks.
     
-    # Convert markdown to HTML
-    html_content = md.convert(content)
+    Args:
+        content: Raw markdown content string
+        
+    Returns:
+        Formatted HTML content string
+    """
+    if not content:
+        return _EMPTY_CONTENT_HTML
     
-    return html_content
+    format_block = _get_block_formatter()
+    return "\n".join(format_block(block) for block in _split_blocks(content))
+
+
+def build_blog_html(content: str) -> str:
+    """Wrap the formatted report in its styled container."""
+    return f'<div class="blog-content">{format_blog_content(content)}</div>'
 
 # ================================================================
 # UI COMPONENTS
 # ================================================================
 
+_FOCUS_OPTIONS = (
+    "Current Trends & Developments",
+    "Market Analysis & Statistics",
+    "Expert Opinions & Insights",
+    "Historical Context & Background",
+    "Case Studies & Examples",
+    "Technology & Innovation",
+    "Financial & Business Impact",
+    "Future Predictions & Outlook",
+    "Competitive Landscape",
+    "Regulatory & Legal Aspects",
+    "Global Perspective & Regional Differences",
+    "Challenges & Opportunities",
+    "Best Practices & Guidelines",
+    "Industry Standards & Benchmarks",
+)
+
+_FOCUS_DEFAULTS = (
+    "Current Trends & Developments",
+    "Expert Opinions & Insights",
+    "Market Analysis & Statistics",
+)
+
 def render_header() -> None:
     """Render the application header."""
     st.markdown(
@@ -469,8 +273,9 @@ def render_sidebar() -> Tuple[str, List[str]]:
     """
     st.sidebar.header("Research Configuration")
 
-    # Research Settings
-    with st.sidebar.container():
+    # Research Settings; inside a form, so adjusting them only reruns the
+    # app once they are applied
+    with st.sidebar.form("research_config", border=False):
         st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
 
         research_depth = st.selectbox(
@@ -482,35 +287,18 @@ def render_sidebar() -> Tuple[str, List[str]]:
 
         focus_areas = st.multiselect(
             "Focus Areas",
-            [
-                "Current Trends & Developments",
-                "Market Analysis & Statistics",
-                "Expert Opinions & Insights",
-                "Historical Context & Background",
-                "Case Studies & Examples",
-                "Technology & Innovation",
-                "Financial & Business Impact",
-                "Future Predictions & Outlook",
-                "Competitive Landscape",
-                "Regulatory & Legal Aspects",
-                "Global Perspective & Regional Differences",
-                "Challenges & Opportunities",
-                "Best Practices & Guidelines",
-                "Industry Standards & Benchmarks",
-            ],
-            default=[
-                "Current Trends & Developments",
-                "Expert Opinions & Insights",
-                "Market Analysis & Statistics",
-            ],
+            _FOCUS_OPTIONS,
+            default=_FOCUS_DEFAULTS,
             help="Select 3-5 areas for optimal results",
         )
 
+        st.form_submit_button("Apply", use_container_width=True)
+
         st.markdown("</div>", unsafe_allow_html=True)
 
     # System Information Dropdown
     with st.sidebar.expander("System Information", expanded=False):
-        st.markdown(f"**Date:** {datetime.now().strftime('%B %d, %Y')}")
+        st.markdown(f"**Date:** {get_date_context()[0]}")
         st.markdown("**AI Model:** Gemini 2.5 Flash Lite")
         st.markdown("**Search Engine:** Google (Serper API)")
         st.markdown("**Version:** 2.1.0")
@@ -547,10 +335,12 @@ def render_research_input() -> Tuple[str, bool]:
         col1, col2 = st.columns([4, 1])
 
         with col1:
-            current_topic = st.session_state.get("research_topic", "")
+            # The input is driven by its key alone; passing value= as well
+            # makes Streamlit warn when a topic link sets the key
+            if "topic_input_form" not in st.session_state:
+                st.session_state.topic_input_form = st.session_state.get("research_topic", "")
             research_topic = st.text_input(
                 "",
-                value=current_topic,
                 placeholder="Enter your research topic..." if not st.session_state.get("research_in_progress", False) else "Research in progress...",
                 key="topic_input_form",
                 label_visibility="collapsed",
@@ -584,20 +374,46 @@ def render_popular_topics() -> None:
             unsafe_allow_html=True,
         )
 
-        example_topics = [
-            "Artificial Intelligence Applications in Healthcare Diagnosis and Treatment Systems for 2025",
-            "Sustainable Energy Solutions and Renewable Technology Adoption in Developing Countries",
-            "Cryptocurrency Market Analysis and Blockchain Technology Integration in Financial Systems",
-            "Climate Change Mitigation Strategies and Environmental Policy Implementation Worldwide",
-            "Quantum Computing Advancements and Their Applications in Scientific Research",
-            "Cybersecurity Threats and Data Protection Measures in Digital Transformation Era",
-        ]
+        st.markdown(_popular_topics_html(), unsafe_allow_html=True)
+
 
-        for i, topic in enumerate(example_topics):
-            if st.button(topic, key=f"topic_link_{i}", help=f"Click to research: {topic}"):
-                st.session_state.research_topic = topic
-                st.session_state.topic_input = topic
-                st.rerun()
+_EXAMPLE_TOPICS = (
+    "Artificial Intelligence Applications in Healthcare Diagnosis and Treatment Systems for 2025",
+    "Sustainable Energy Solutions and Renewable Technology Adoption in Developing Countries",
+    "Cryptocurrency Market Analysis and Blockchain Technology Integration in Financial Systems",
+    "Climate Change Mitigation Strategies and Environmental Policy Implementation Worldwide",
+    "Quantum Computing Advancements and Their Applications in Scientific Research",
+    "Cybersecurity Threats and Data Protection Measures in Digital Transformation Era",
+)
+
+
+@st.cache_resource(show_spinner=False)
+def _popular_topics_html() -> str:
+    """
+    Build the topic list as one block of links, emitted in a single element.
+
+    Each link carries its topic in the ``topic`` query parameter, which
+    ``apply_topic_from_query`` picks up on the next run.
+    """
+    links = "".join(
+        f'<a class="topic-link" href="?topic={quote_plus(topic)}" target="_self" '
+        f'title="Click to research: {html.escape(topic)}">{html.escape(topic)}</a>'
+        for topic in _EXAMPLE_TOPICS
+    )
+    return f'<div class="topic-links">{links}</div>'
+
+
+def apply_topic_from_query() -> None:
+    """Prefill the research topic from a clicked popular-topic link."""
+    topic = st.query_params.get("topic")
+    if not topic:
+        return
+
+    del st.query_params["topic"]
+    if not st.session_state.get("research_in_progress", False):
+        st.session_state.research_topic = topic
+        st.session_state.topic_input = topic
+        st.session_state.topic_input_form = topic
 
 
 def render_research_progress_minimal(completed_tasks: int, total_tasks: int) -> None:
@@ -640,11 +456,13 @@ def render_blog_report(blog_content: str, research_topic: str) -> None:
     )
 
     if blog_content:
-        formatted_content = format_blog_content(blog_content)
-        st.markdown(
-            f'<div class="blog-content">{formatted_content}</div>',
-            unsafe_allow_html=True,
-        )
+        # The wrapped HTML is memoized per session alongside blog_content, so
+        # reruns on the report page skip formatting and cache lookups
+        blog_html = st.session_state.get("blog_html")
+        if blog_html is None:
+            blog_html = build_blog_html(blog_content)
+            st.session_state.blog_html = blog_html
+        st.markdown(blog_html, unsafe_allow_html=True)
     else:
         st.error("No content generated. Please try again.")
 
@@ -657,7 +475,7 @@ def render_blog_report(blog_content: str, research_topic: str) -> None:
             st.download_button(
                 label="Download Report",
                 data=blog_content,
-                file_name=f"research_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                file_name=f"research_report_{st.session_state.report_stamp}.txt",
                 mime="text/plain",
             )
 
@@ -667,8 +485,7 @@ def render_blog_report(blog_content: str, research_topic: str) -> None:
 
     with col3:
         if st.button("New Research", key="new_research_btn"):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            st.session_state.clear()
             st.rerun()
     
     st.markdown("</div>", unsafe_allow_html=True)
@@ -687,6 +504,28 @@ def initialize_session_state() -> None:
         st.session_state.blog_content = ""
     if "current_topic" not in st.session_state:
         st.session_state.current_topic = ""
+    if "report_stamp" not in st.session_state:
+        st.session_state.report_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    _prewarm_research_imports()
+
+
+@st.cache_resource(show_spinner=False)
+def _prewarm_research_imports() -> threading.Thread:
+    """
+    Import the research stack in the background once per server process.
+
+    The import runs while the user is still typing a topic, so the first
+    research run does not pay for loading LangChain and the Gemini SDK.
+    """
+    def _import_research_stack() -> None:
+        import main  # noqa: F401
+
+    thread = threading.Thread(
+        target=_import_research_stack, name="research-prewarm", daemon=True
+    )
+    thread.start()
+    return thread
 
 
 def validate_environment() -> bool:
@@ -705,6 +544,61 @@ def validate_environment() -> bool:
         st.info("Required: SERPER_API_KEY and GOOGLE_API_KEY in your .env file")
         return False
 
+def _api_key_fingerprint() -> str:
+    """Hash the configured API keys, so a key change builds a new coordinator."""
+    keys = "\0".join(os.getenv(key, "") for key in ("GOOGLE_API_KEY", "SERPER_API_KEY"))
+    return hashlib.sha256(keys.encode("utf-8")).hexdigest()
+
+
+# Only the current coordinator is kept; one built for an earlier date or
+# key is evicted along with its clients, caches and database connection
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_coordinator(current_date: str, api_key_hash: str) -> "StreamlinedCoordinator":
+    """
+    Build the research coordinator once and reuse it across reruns.
+
+    Args:
+        current_date: Cache key, so the model's date instruction stays current
+        api_key_hash: Cache key, so rotated API keys are picked up
+
+    Returns:
+        Shared StreamlinedCoordinator instance
+    """
+    from main import StreamlinedCoordinator
+
+    return StreamlinedCoordinator(get_llm())
+
+@st.cache_resource(show_spinner=False)
+def _get_report_cache() -> Tuple[TTLCache, threading.Lock]:
+    """Hold generated reports for an hour, shared across sessions."""
+    return TTLCache(maxsize=64, ttl=3600), threading.Lock()
+
+
+def _report_cache_key(
+    research_topic: str, focus_areas: List[str], research_results: Dict[str, Any]
+) -> str:
+    """Hash the inputs that determine the analysis and the report."""
+    # orjson serializes the string-heavy results far faster than json
+    payload = orjson.dumps(
+        [research_topic, sorted(focus_areas), research_results],
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _lookup_report(key: str) -> Optional[str]:
+    cache, lock = _get_report_cache()
+    with lock:
+        return cache.get(key)
+
+
+def _store_report(key: str, blog_content: str) -> None:
+    cache, lock = _get_report_cache()
+    with lock:
+        cache[key] = blog_content
+
+
 def execute_research_workflow(research_topic: str, focus_areas: List[str]) -> bool:
     """
     Execute the main research workflow with continuous progress tracking.
@@ -723,8 +617,7 @@ def execute_research_workflow(research_topic: str, focus_areas: List[str]) -> bo
         st.session_state.focus_areas = focus_areas
 
         # Environment already loaded in validate_environment()
-        llm = get_llm()
-        coordinator = StreamlinedCoordinator(llm)
+        coordinator = get_coordinator(get_date_context()[0], _api_key_fingerprint())
         progress_placeholder = st.empty()
 
         start_time = time.time()
@@ -744,54 +637,81 @@ def execute_research_workflow(research_topic: str, focus_areas: List[str]) -> bo
         research_results = {}
         base_progress = 0.1  # 10% for initialization
         research_progress_range = 0.6  # 60% for research tasks
-        
-        for i, task in enumerate(tasks):
-            # Calculate progress within research phase
-            task_progress = base_progress + (i / total_tasks) * research_progress_range
-            
+
+        def render_task_progress(completed: int) -> None:
+            fraction = completed / total_tasks if total_tasks else 1.0
+            task_progress = base_progress + fraction * research_progress_range
             with progress_placeholder.container():
                 st.markdown('<div class="task-progress-minimal">', unsafe_allow_html=True)
                 st.markdown(f'<div class="progress-text">Executing research tasks... {task_progress:.0%} complete</div>', unsafe_allow_html=True)
                 st.progress(task_progress)
                 st.markdown('</div>', unsafe_allow_html=True)
 
-            with st.spinner(f"Executing: {task.description}"):
-                result = coordinator.researcher.execute_task(task, focus_areas)
-                research_results[task.task_type.value] = result
-
-            time.sleep(0.2)
-
-        # Phase 3: Analysis (70-85%)
-        with progress_placeholder.container():
-            st.markdown('<div class="task-progress-minimal">', unsafe_allow_html=True)
-            st.markdown('<div class="progress-text">Analyzing research findings... 70% complete</div>', unsafe_allow_html=True)
-            st.progress(0.7)
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        with st.spinner("Analyzing research findings..."):
-            analysis = coordinator.analyzer.analyze(research_results)
-
-        # Phase 4: Report generation (85-100%)
-        with progress_placeholder.container():
-            st.markdown('<div class="task-progress-minimal">', unsafe_allow_html=True)
-            st.markdown('<div class="progress-text">Generating comprehensive report... 85% complete</div>', unsafe_allow_html=True)
-            st.progress(0.85)
-            st.markdown('</div>', unsafe_allow_html=True)
+        # Tasks are network-bound, so run them side by side and advance the
+        # progress bar as each one finishes; widgets are only touched here
+        render_task_progress(0)
+        results_by_type = {}
+        with st.spinner(f"Executing {total_tasks} research tasks..."):
+            max_workers = max(1, min(coordinator.researcher.MAX_CONCURRENT_TASKS, total_tasks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(coordinator.researcher.execute_task, task, focus_areas): task
+                    for task in tasks
+                }
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    results_by_type[futures[future].task_type.value] = future.result()
+                    render_task_progress(completed)
+
+        # Keep the plan's order for the analysis and report prompts
+        for task in tasks:
+            research_results[task.task_type.value] = results_by_type[task.task_type.value]
+
+        # Identical findings for the same topic and focus replay the last
+        # report instead of running the analysis and report prompts again
+        report_key = _report_cache_key(research_topic, focus_areas, research_results)
+        blog_content = _lookup_report(report_key)
+
+        if blog_content is None:
+            # Phase 3: Analysis (70-85%)
+            with progress_placeholder.container():
+                st.markdown('<div class="task-progress-minimal">', unsafe_allow_html=True)
+                st.markdown('<div class="progress-text">Analyzing research findings... 70% complete</div>', unsafe_allow_html=True)
+                st.progress(0.7)
+                st.markdown('</div>', unsafe_allow_html=True)
 
-        with st.spinner("Generating comprehensive report..."):
-            blog_content = coordinator.reporter.generate_blog_report(
-                research_topic, research_results, analysis
+            # Stream the analysis so the first insights show up immediately
+            analysis_placeholder = st.empty()
+            with analysis_placeholder.container():
+                key_insights = st.write_stream(
+                    coordinator.analyzer.stream_insights(research_results, focus_areas)
+                )
+            analysis = coordinator.analyzer.build_analysis(
+                research_results, key_insights, focus_areas
             )
-            st.session_state.blog_content = blog_content
+            analysis_placeholder.empty()
 
-        # Final completion (100%)
-        with progress_placeholder.container():
-            st.markdown('<div class="task-progress-minimal">', unsafe_allow_html=True)
-            st.markdown('<div class="progress-text">Research completed! 100% complete</div>', unsafe_allow_html=True)
-            st.progress(1.0)
-            st.markdown('</div>', unsafe_allow_html=True)
+            # Phase 4: Report generation (85-100%)
+            with progress_placeholder.container():
+                st.markdown('<div class="task-progress-minimal">', unsafe_allow_html=True)
+                st.markdown('<div class="progress-text">Generating comprehensive report... 85% complete</div>', unsafe_allow_html=True)
+                st.progress(0.85)
+                st.markdown('</div>', unsafe_allow_html=True)
 
-        time.sleep(1)
+            # Stream the report so the user reads it while it is being written;
+            # the markdown-to-HTML conversion runs once, in render_blog_report
+            report_placeholder = st.empty()
+            with report_placeholder.container():
+                blog_content = st.write_stream(
+                    coordinator.reporter.stream_blog_report(
+                        research_topic, research_results, analysis, focus_areas
+                    )
+                )
+            report_placeholder.empty()
+            _store_report(report_key, blog_content)
+
+        st.session_state.blog_content = blog_content
+        st.session_state.blog_html = build_blog_html(blog_content)
+        st.session_state.report_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         progress_placeholder.empty()
 
         # Clear research in progress flag and set completion
@@ -801,9 +721,6 @@ def execute_research_workflow(research_topic: str, focus_areas: List[str]) -> bo
         end_time = time.time()
         st.success(f"Research completed in {end_time - start_time:.1f} seconds")
 
-        time.sleep(1)
-        st.rerun()
-
         return True
 
     except (ConfigurationError, ResearchError) as e:
@@ -820,19 +737,26 @@ def execute_research_workflow(research_topic: str, focus_areas: List[str]) -> bo
 def main() -> None:
     """Main application entry point."""
     initialize_session_state()
+    apply_topic_from_query()
     render_header()
     research_depth, focus_areas = render_sidebar()
 
     if not st.session_state.research_complete:
-        research_topic, start_research = render_research_input()
-        
-        # Only show popular topics if research hasn't started
-        render_popular_topics()
+        # Keep the input area in one container so it can be cleared once the
+        # research finishes and the report is rendered in this same pass
+        input_area = st.empty()
+        with input_area.container():
+            research_topic, start_research = render_research_input()
+
+            # Only show popular topics if research hasn't started
+            render_popular_topics()
 
         if start_research and research_topic:
             if validate_environment():
-                execute_research_workflow(research_topic, focus_areas)
-    else:
+                if execute_research_workflow(research_topic, focus_areas):
+                    input_area.empty()
+
+    if st.session_state.research_complete:
         render_blog_report(
             st.session_state.blog_content, st.session_state.current_topic
         )
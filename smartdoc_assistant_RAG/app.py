@@ -10,12 +10,16 @@ License: MIT
 """
 
 import logging
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from itertools import islice
+from typing import Optional, Dict, Tuple
 
+import numpy as np
 import streamlit as st
 
-from file_processor import extract_text_from_file
+from file_processor import file_digest, iter_text_from_bytes
 from rag import EnhancedRAG
 
 # Configure logging for the application
@@ -24,6 +28,118 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# PyPDF2 logs a warning for every malformed object it recovers from
+logging.getLogger("PyPDF2").setLevel(logging.ERROR)
+
+
+_CUSTOM_CSS = """
+<style>
+    /* Chat container styling */
+    .chat-container {
+        background-color: #f8f9fa;
+        border-radius: 10px;
+        padding: 20px;
+        margin: 10px 0;
+        border: 1px solid #dee2e6;
+        max-height: 500px;
+        overflow-y: auto;
+    }
+
+    /* Message timestamp styling */
+    .message-time {
+        font-size: 11px;
+        color: #6c757d;
+        text-align: right;
+        margin-top: 5px;
+        font-style: italic;
+    }
+
+    /* Session info styling */
+    .session-info {
+        background-color: #f8f9fa;
+        border-radius: 8px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+
+    /* Input area styling */
+    .chat-input-area {
+        margin-top: 20px;
+        padding-top: 15px;
+        border-top: 1px solid #dee2e6;
+    }
+
+    /* Welcome message styling */
+    .welcome-container {
+        text-align: center;
+        color: #6c757d;
+        padding: 30px;
+    }
+
+    /* Error message styling */
+    .stError {
+        margin-top: 10px;
+    }
+</style>
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _custom_css() -> str:
+    """Return the stylesheet with indentation stripped, built once per process."""
+    return "\n".join(line.strip() for line in _CUSTOM_CSS.splitlines() if line.strip())
+
+
+@st.cache_resource(show_spinner=False)
+def get_rag_model() -> EnhancedRAG:
+    """
+    Load the RAG system once per server process and share it between sessions.
+
+    Returns:
+        EnhancedRAG: Shared system; each session keeps its own document index
+    """
+    return EnhancedRAG()
+
+
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def extract_pages_cached(file_bytes: bytes, mime_type: str) -> Tuple[str, ...]:
+    """
+    Extract a document's pages once per content, shared across reruns and sessions.
+
+    Args:
+        file_bytes (bytes): Raw file content, hashed by Streamlit for the cache key
+        mime_type (str): Client-provided MIME type, used when the content
+            has no known file signature
+
+    Returns:
+        Tuple[str, ...]: Page texts
+    """
+    return tuple(iter_text_from_bytes(file_bytes, mime_type))
+
+
+@dataclass
+class ChatMessage:
+    """
+    A chat message as shown in the conversation.
+
+    Attributes:
+        role: Message role ('user' or 'assistant')
+        content: Message text
+        timestamp: Time the message was sent, in HH:MM format
+    """
+
+    # Declared by hand rather than with dataclass(slots=True), which needs
+    # Python 3.10
+    __slots__ = ("role", "content", "timestamp")
+
+    role: str
+    content: str
+    timestamp: str
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return the message in the format expected by EnhancedRAG.chat."""
+        return {"role": self.role, "content": self.content}
+
 
 class SmartDocAssistant:
     """
@@ -39,6 +155,16 @@ class SmartDocAssistant:
     MAX_FILE_SIZE_MB = 20
     SUPPORTED_FORMATS = ["pdf", "docx", "txt"]
 
+    # Semantic response cache: near-identical questions about the same
+    # document, asked with no conversation before them, are answered from
+    # earlier responses
+    SEMANTIC_CACHE_SIZE = 128
+    SEMANTIC_CACHE_THRESHOLD = 0.97
+
+    # Chat messages kept in the session, oldest dropped first; the model sees
+    # only the last EnhancedRAG.MAX_CHAT_HISTORY of them
+    MAX_STORED_MESSAGES = 200
+
     # UI styling constants
     CHAT_CONTAINER_HEIGHT = "500px"
     TIMESTAMP_FORMAT = "%H:%M"
@@ -61,68 +187,19 @@ class SmartDocAssistant:
             )
             logger.debug("Page configuration completed successfully")
         except Exception as e:
-            logger.error(f"Failed to configure page: {e}")
+            logger.error("Failed to configure page: %s", e)
             raise
 
     def _inject_custom_styles(self) -> None:
         """Inject custom CSS styles for enhanced UI appearance."""
         try:
-            custom_css = """
-            <style>
-                /* Chat container styling */
-                .chat-container {
-                    background-color: #f8f9fa;
-                    border-radius: 10px;
-                    padding: 20px;
-                    margin: 10px 0;
-                    border: 1px solid #dee2e6;
-                    max-height: 500px;
-                    overflow-y: auto;
-                }
-                
-                /* Message timestamp styling */
-                .message-time {
-                    font-size: 11px;
-                    color: #6c757d;
-                    text-align: right;
-                    margin-top: 5px;
-                    font-style: italic;
-                }
-                
-                /* Session info styling */
-                .session-info {
-                    background-color: #f8f9fa;
-                    border-radius: 8px;
-                    padding: 10px;
-                    margin: 5px 0;
-                }
-                
-                /* Input area styling */
-                .chat-input-area {
-                    margin-top: 20px;
-                    padding-top: 15px;
-                    border-top: 1px solid #dee2e6;
-                }
-                
-                /* Welcome message styling */
-                .welcome-container {
-                    text-align: center;
-                    color: #6c757d;
-                    padding: 30px;
-                }
-                
-                /* Error message styling */
-                .stError {
-                    margin-top: 10px;
-                }
-            </style>
-            """
-
-            st.markdown(custom_css, unsafe_allow_html=True)
+            # st.html with only a style element is not parsed as markdown and
+            # takes no space in the layout
+            st.html(_custom_css())
             logger.debug("Custom CSS styles injected successfully")
 
         except Exception as e:
-            logger.warning(f"Failed to inject custom styles: {e}")
+            logger.warning("Failed to inject custom styles: %s", e)
 
     def _initialize_session_state(self) -> None:
         """Initialize and configure Streamlit session state variables."""
@@ -130,7 +207,10 @@ class SmartDocAssistant:
             # Initialize RAG model
             if "rag_model" not in st.session_state:
                 try:
-                    st.session_state.rag_model = EnhancedRAG()
+                    st.session_state.rag_model = get_rag_model()
+                    st.session_state.doc_index = (
+                        st.session_state.rag_model.new_document_index()
+                    )
                     logger.info("RAG model initialized successfully")
                 except ValueError as e:
                     error_msg = f"❌ Failed to initialize RAG model: {str(e)}"
@@ -140,11 +220,12 @@ class SmartDocAssistant:
 
             # Initialize other session variables with defaults
             session_defaults = {
-                "chat_history": [],
+                "messages": deque(maxlen=self.MAX_STORED_MESSAGES),
                 "file_processed": False,
-                "message_timestamps": [],
                 "current_document_name": None,
+                "current_document_hash": None,
                 "document_stats": {},
+                "semantic_cache": [],
             }
 
             for key, default_value in session_defaults.items():
@@ -153,7 +234,7 @@ class SmartDocAssistant:
             logger.debug("Session state initialized successfully")
 
         except Exception as e:
-            logger.error(f"Failed to initialize session state: {e}")
+            logger.error("Failed to initialize session state: %s", e)
             raise
 
     @staticmethod
@@ -167,33 +248,19 @@ class SmartDocAssistant:
         return datetime.now().strftime(SmartDocAssistant.TIMESTAMP_FORMAT)
 
     @staticmethod
-    def display_message_with_timestamp(
-        message: Dict[str, Any], role: str, timestamp: Optional[str] = None
-    ) -> None:
+    def display_message_with_timestamp(message: ChatMessage) -> None:
         """
         Display a chat message with WhatsApp-style timestamp.
 
         Args:
-            message (Dict[str, Any]): Message dictionary containing content
-            role (str): Message role ('user' or 'assistant')
-            timestamp (Optional[str]): Message timestamp
+            message (ChatMessage): Message to display
         """
         try:
-            with st.chat_message(role):
-                # Display message content
-                if isinstance(message, dict) and "content" in message:
-                    st.write(message["content"])
-                else:
-                    st.write(str(message))
-
-                # Display timestamp if provided
-                if timestamp:
-                    st.markdown(
-                        f'<div class="message-time">{timestamp}</div>',
-                        unsafe_allow_html=True,
-                    )
+            with st.chat_message(message.role):
+                st.write(message.content)
+                st.html(f'<div class="message-time">{message.timestamp}</div>')
         except Exception as e:
-            logger.warning(f"Error displaying message: {e}")
+            logger.warning("Error displaying message: %s", e)
             st.error("Error displaying message")
 
     def _handle_file_upload(self) -> None:
@@ -210,11 +277,11 @@ class SmartDocAssistant:
             )
 
             if uploaded_file is not None:
-                # Validate file size
-                file_size_mb = uploaded_file.size / (1024 * 1024)
-                if file_size_mb > self.MAX_FILE_SIZE_MB:
+                # Validate file size (the uploader already rejects larger files
+                # client-side via server.maxUploadSize in .streamlit/config.toml)
+                if uploaded_file.size > self.MAX_FILE_SIZE_MB << 20:
                     st.error(
-                        f"File size ({file_size_mb:.1f}MB) exceeds maximum allowed size ({self.MAX_FILE_SIZE_MB}MB)"
+                        f"File size ({uploaded_file.size / (1 << 20):.1f}MB) exceeds maximum allowed size ({self.MAX_FILE_SIZE_MB}MB)"
                     )
                     return
 
@@ -222,8 +289,7 @@ class SmartDocAssistant:
                 self._process_uploaded_file(uploaded_file)
 
         except Exception as e:
-            error_msg = f"Error handling file upload: {e}"
-            logger.error(error_msg)
+            logger.error("Error handling file upload: %s", e)
             st.error("❌ Failed to handle file upload. Please try again.")
 
     def _process_uploaded_file(self, uploaded_file) -> None:
@@ -234,23 +300,60 @@ class SmartDocAssistant:
             uploaded_file: Streamlit uploaded file object
         """
         try:
-            with st.spinner("🔄 Processing document..."):
-                logger.info(f"Processing uploaded file: {uploaded_file.name}")
-
-                # Extract text from file
-                text = extract_text_from_file(uploaded_file)
+            # Reruns keep the index built for this content; a different file
+            # uploaded under the same name is processed again
+            file_bytes = uploaded_file.getvalue()
+            doc_hash = file_digest(file_bytes)
+            if (
+                st.session_state.file_processed
+                and st.session_state.current_document_hash == doc_hash
+            ):
+                st.session_state.current_document_name = uploaded_file.name
+                self._show_document_stats(uploaded_file.name)
+                return
 
-                if text and text.strip():
-                    # Build document index
-                    st.session_state.rag_model.build_index(text)
+            if st.session_state.file_processed:
+                st.session_state.rag_model.reset_index(st.session_state.doc_index)
 
+            with st.spinner("🔄 Processing document..."):
+                logger.info("Processing uploaded file: %s", uploaded_file.name)
+
+                mime_type = getattr(uploaded_file, "type", "")
+                rag_model = st.session_state.rag_model
+                vector_db = st.session_state.doc_index
+
+                # Seen before: the saved index, which carries the document's
+                # counts, replaces both extraction and re-embedding
+                if rag_model.load_index(doc_hash, vector_db):
+                    if not vector_db.char_count:
+                        # Saved before character counts were stored
+                        vector_db.char_count = sum(
+                            map(len, extract_pages_cached(file_bytes, mime_type))
+                        )
+                else:
+                    # The indexer counts words and characters while it splits
+                    # the extracted pages
+                    try:
+                        rag_model.build_index(
+                            extract_pages_cached(file_bytes, mime_type), vector_db
+                        )
+                    except Exception:
+                        # A document without text cannot be indexed; that is
+                        # reported below as an extraction failure
+                        if vector_db.word_count:
+                            raise
+                    if vector_db:
+                        rag_model.save_index(doc_hash, vector_db)
+
+                if vector_db.word_count:
                     # Update session state
                     st.session_state.file_processed = True
                     st.session_state.current_document_name = uploaded_file.name
+                    st.session_state.current_document_hash = doc_hash
 
-                    # Calculate document statistics
-                    char_count = len(text)
-                    word_count = len(text.split())
+                    # Document statistics
+                    char_count = vector_db.char_count
+                    word_count = vector_db.word_count
                     st.session_state.document_stats = {
                         "characters": char_count,
                         "words": word_count,
@@ -258,13 +361,12 @@ class SmartDocAssistant:
                     }
 
                     # Display success message and stats
-                    st.success(f"✅ Successfully processed: {uploaded_file.name}")
-                    st.info(
-                        f"📄 Document: {char_count:,} characters, {word_count:,} words"
-                    )
+                    self._show_document_stats(uploaded_file.name)
 
                     logger.info(
-                        f"Document processed successfully: {word_count} words, {char_count} characters"
+                        "Document processed successfully: %s words, %s characters",
+                        word_count,
+                        char_count,
                     )
 
                 else:
@@ -272,16 +374,29 @@ class SmartDocAssistant:
                         "❌ Could not extract text from file. Please check the file format and try again."
                     )
                     logger.warning(
-                        f"Failed to extract text from file: {uploaded_file.name}"
+                        "Failed to extract text from file: %s", uploaded_file.name
                     )
 
         except Exception as e:
-            error_msg = f"Error processing file {uploaded_file.name}: {e}"
-            logger.error(error_msg)
+            logger.error("Error processing file %s: %s", uploaded_file.name, e)
             st.error(
                 "❌ Failed to process document. Please try again with a different file."
             )
 
+    @staticmethod
+    def _show_document_stats(file_name: str) -> None:
+        """
+        Display the success message and statistics for the processed document.
+
+        Args:
+            file_name (str): Name of the processed file
+        """
+        stats = st.session_state.document_stats
+        st.success(f"✅ Successfully processed: {file_name}")
+        st.info(
+            f"📄 Document: {stats['characters']:,} characters, {stats['words']:,} words"
+        )
+
     def _render_chat_controls(self) -> None:
         """Render chat control buttons in the sidebar."""
         st.header("💬 Chat Controls")
@@ -300,31 +415,44 @@ class SmartDocAssistant:
                 self._remove_current_document()
 
         except Exception as e:
-            logger.error(f"Error rendering chat controls: {e}")
+            logger.error("Error rendering chat controls: %s", e)
             st.error("❌ Error with chat controls")
 
     def _clear_chat_history(self) -> None:
-        """Clear the chat history and timestamps."""
+        """Clear the chat history."""
         try:
-            st.session_state.chat_history = []
-            st.session_state.message_timestamps = []
+            st.session_state.messages.clear()
             logger.info("Chat history cleared successfully")
             st.rerun()
         except Exception as e:
-            logger.error(f"Error clearing chat history: {e}")
+            logger.error("Error clearing chat history: %s", e)
             st.error("❌ Failed to clear chat history")
 
     def _remove_current_document(self) -> None:
-        """Remove the currently loaded document and reset the index."""
+        """
+        Remove the currently loaded document from the session.
+
+        Only the in-memory index is released; the saved copy on disk is kept
+        so uploading the same document again does not re-embed it.
+        """
         try:
+            # Cached answers are only valid for the document they came from
+            document = st.session_state.current_document_hash
+            st.session_state.semantic_cache[:] = [
+                entry
+                for entry in st.session_state.semantic_cache
+                if entry[0] != document
+            ]
+
             st.session_state.file_processed = False
             st.session_state.current_document_name = None
+            st.session_state.current_document_hash = None
             st.session_state.document_stats = {}
-            st.session_state.rag_model.reset_index()
+            st.session_state.rag_model.reset_index(st.session_state.doc_index)
             logger.info("Current document removed and index reset")
             st.rerun()
         except Exception as e:
-            logger.error(f"Error removing document: {e}")
+            logger.error("Error removing document: %s", e)
             st.error("❌ Failed to remove document")
 
     def _render_session_info(self) -> None:
@@ -332,14 +460,11 @@ class SmartDocAssistant:
         st.header("📊 Session Info")
 
         try:
-            # Session info container with custom styling
-            st.markdown('<div class="session-info">', unsafe_allow_html=True)
-
             # Display metrics in columns
             col1, col2 = st.columns(2)
 
             with col1:
-                message_count = len(st.session_state.chat_history)
+                message_count = len(st.session_state.messages)
                 st.metric("Messages", message_count)
 
             with col2:
@@ -354,55 +479,27 @@ class SmartDocAssistant:
                 st.caption(f"📎 {st.session_state.current_document_name}")
 
                 # Show conversation context info
-                if st.session_state.chat_history:
+                if st.session_state.messages:
                     st.caption("💭 Last 10 messages used for context")
 
-            st.markdown("</div>", unsafe_allow_html=True)
 
         except Exception as e:
-            logger.error(f"Error rendering session info: {e}")
+            logger.error("Error rendering session info: %s", e)
             st.error("❌ Error displaying session info")
 
-    def _ensure_timestamp_sync(self) -> None:
-        """Ensure message timestamps list is synchronized with chat history."""
-        try:
-            while len(st.session_state.message_timestamps) < len(
-                st.session_state.chat_history
-            ):
-                st.session_state.message_timestamps.append(self.generate_timestamp())
-        except Exception as e:
-            logger.warning(f"Error synchronizing timestamps: {e}")
-
     def _render_chat_history(self) -> None:
         """Render the chat history with timestamps in a styled container."""
         try:
-            # Start chat container
-            st.markdown('<div class="chat-container">', unsafe_allow_html=True)
-
-            if st.session_state.chat_history:
-                # Ensure timestamps are synchronized
-                self._ensure_timestamp_sync()
-
+            if st.session_state.messages:
                 # Display each message with its timestamp
-                for i, message in enumerate(st.session_state.chat_history):
-                    timestamp = (
-                        st.session_state.message_timestamps[i]
-                        if i < len(st.session_state.message_timestamps)
-                        else None
-                    )
-
-                    self.display_message_with_timestamp(
-                        message, message["role"], timestamp
-                    )
+                for message in st.session_state.messages:
+                    self.display_message_with_timestamp(message)
             else:
                 # Display welcome message
                 self._render_welcome_message()
 
-            # Close chat container
-            st.markdown("</div>", unsafe_allow_html=True)
-
         except Exception as e:
-            logger.error(f"Error rendering chat history: {e}")
+            logger.error("Error rendering chat history: %s", e)
             st.error("❌ Error displaying chat history")
 
     def _render_welcome_message(self) -> None:
@@ -413,7 +510,7 @@ class SmartDocAssistant:
             <p>Upload a document to get started or ask general questions.</p>
         </div>
         """
-        st.markdown(welcome_html, unsafe_allow_html=True)
+        st.html(welcome_html)
 
     def _get_chat_placeholder_text(self) -> str:
         """
@@ -436,7 +533,7 @@ class SmartDocAssistant:
             user_prompt (str): User's input message
         """
         try:
-            logger.info(f"Processing user input: '{user_prompt[:50]}...'")
+            logger.info("Processing user input: '%.50s...'", user_prompt)
 
             # Generate timestamps
             user_timestamp = self.generate_timestamp()
@@ -444,46 +541,132 @@ class SmartDocAssistant:
             # Display user message immediately
             with st.chat_message("user"):
                 st.write(user_prompt)
-                st.markdown(
-                    f'<div class="message-time">{user_timestamp}</div>',
-                    unsafe_allow_html=True,
-                )
+                st.html(f'<div class="message-time">{user_timestamp}</div>')
 
             # Generate and display AI response
             with st.chat_message("assistant"):
-                with st.spinner("🤔 Thinking..."):
-                    try:
-                        response, updated_history = st.session_state.rag_model.chat(
-                            user_prompt, st.session_state.chat_history
+                try:
+                    rag_model = st.session_state.rag_model
+
+                    # Only the window the model sees is passed along
+                    messages = st.session_state.messages
+                    context_history = [
+                        message.as_dict()
+                        for message in islice(
+                            messages,
+                            max(len(messages) - EnhancedRAG.MAX_CHAT_HISTORY, 0),
+                            None,
                         )
-
-                        # Display response
+                    ]
+
+                    # Answers that depend on the conversation so far ("tell me
+                    # more", "summarize our chat") are never cached or replayed
+                    use_cache = not context_history
+                    query_embedding = None
+                    response = None
+                    if use_cache:
+                        with st.spinner("🤔 Thinking..."):
+                            query_embedding = rag_model.embed(user_prompt)
+                            response = self._lookup_cached_response(query_embedding)
+                    answered = response is not None
+
+                    if answered:
+                        logger.info("Answered from semantic cache")
                         st.write(response)
-
-                        # Generate assistant timestamp
-                        assistant_timestamp = self.generate_timestamp()
-                        st.markdown(
-                            f'<div class="message-time">{assistant_timestamp}</div>',
-                            unsafe_allow_html=True,
+                    else:
+                        # Show the answer as it is generated, then replace it
+                        # with the cleaned text if cleaning changed anything
+                        placeholder = st.empty()
+                        with placeholder:
+                            streamed = st.write_stream(
+                                rag_model.chat_stream(
+                                    user_prompt,
+                                    context_history,
+                                    st.session_state.doc_index,
+                                    query_embedding,
+                                )
+                            )
+                        response = rag_model.clean_response(streamed)
+                        if response != streamed:
+                            placeholder.write(response)
+
+                        # Only keep real answers, not error fallbacks
+                        answered = not streamed.endswith(
+                            tuple(EnhancedRAG.ERROR_RESPONSES)
                         )
+                        if answered and use_cache:
+                            self._cache_response(query_embedding, response)
+
+                    # Generate assistant timestamp
+                    assistant_timestamp = self.generate_timestamp()
+                    st.html(
+                        f'<div class="message-time">{assistant_timestamp}</div>'
+                    )
 
-                        # Update session state
-                        st.session_state.chat_history = updated_history
-                        st.session_state.message_timestamps.extend(
-                            [user_timestamp, assistant_timestamp]
+                    # Update session state; the deque drops the oldest
+                    # messages beyond MAX_STORED_MESSAGES
+                    if answered:
+                        st.session_state.messages.extend(
+                            (
+                                ChatMessage("user", user_prompt, user_timestamp),
+                                ChatMessage(
+                                    "assistant", response, assistant_timestamp
+                                ),
+                            )
                         )
 
-                        logger.info("User input processed successfully")
+                    logger.info("User input processed successfully")
 
-                    except Exception as e:
-                        error_msg = f"Error generating response: {e}"
-                        logger.error(error_msg)
-                        st.error("❌ Sorry, I encountered an error. Please try again.")
+                except Exception as e:
+                    logger.error("Error generating response: %s", e)
+                    st.error("❌ Sorry, I encountered an error. Please try again.")
 
         except Exception as e:
-            logger.error(f"Error handling user input: {e}")
+            logger.error("Error handling user input: %s", e)
             st.error("❌ Failed to process your message. Please try again.")
 
+    def _lookup_cached_response(self, query_embedding: np.ndarray) -> Optional[str]:
+        """
+        Return a cached response for a near-identical question about this document.
+
+        Args:
+            query_embedding (np.ndarray): Normalized embedding of the question
+
+        Returns:
+            Optional[str]: Cached response, or None on a miss
+        """
+        document = st.session_state.current_document_hash
+        cache = st.session_state.semantic_cache
+        candidates = [i for i, entry in enumerate(cache) if entry[0] == document]
+        if not candidates:
+            return None
+
+        # Embeddings are unit length, so one matrix-vector product gives cosines
+        similarities = np.stack([cache[i][1] for i in candidates]) @ query_embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        # Move the hit to the most recently used end
+        entry = cache.pop(candidates[best])
+        cache.append(entry)
+        return entry[2]
+
+    def _cache_response(self, query_embedding: np.ndarray, response: str) -> None:
+        """
+        Remember a response for its question, evicting the least recently used.
+
+        Args:
+            query_embedding (np.ndarray): Normalized embedding of the question
+            response (str): Generated response
+        """
+        cache = st.session_state.semantic_cache
+        cache.append(
+            (st.session_state.current_document_hash, query_embedding, response)
+        )
+        if len(cache) > self.SEMANTIC_CACHE_SIZE:
+            del cache[0]
+
     def _render_chat_interface(self) -> None:
         """Render the main chat interface."""
         try:
@@ -491,9 +674,6 @@ class SmartDocAssistant:
             # Render chat history
             self._render_chat_history()
 
-            # Render chat input area
-            st.markdown('<div class="chat-input-area">', unsafe_allow_html=True)
-
             # Get dynamic placeholder text
             placeholder_text = self._get_chat_placeholder_text()
 
@@ -515,10 +695,8 @@ class SmartDocAssistant:
                     "💡 **Tip:** Upload a document to ask specific questions about its content, or ask general questions for web-based answers."
                 )
 
-            st.markdown("</div>", unsafe_allow_html=True)
-
         except Exception as e:
-            logger.error(f"Error rendering chat interface: {e}")
+            logger.error("Error rendering chat interface: %s", e)
             st.error("❌ Error with chat interface")
 
     def render_sidebar(self) -> None:
@@ -537,7 +715,7 @@ class SmartDocAssistant:
                 self._render_session_info()
 
         except Exception as e:
-            logger.error(f"Error rendering sidebar: {e}")
+            logger.error("Error rendering sidebar: %s", e)
             st.error("❌ Error with sidebar components")
 
     def run(self) -> None:
@@ -558,7 +736,7 @@ class SmartDocAssistant:
             self._render_chat_interface()
 
         except Exception as e:
-            logger.error(f"Critical error in application: {e}")
+            logger.error("Critical error in application: %s", e)
             st.error("❌ A critical error occurred. Please refresh the page.")
 
 
@@ -568,7 +746,7 @@ def main() -> None:
         app = SmartDocAssistant()
         app.run()
     except Exception as e:
-        logger.critical(f"Failed to start application: {e}")
+        logger.critical("Failed to start application: %s", e)
         st.error(
             "❌ Failed to start the application. Please check the logs and try again."
         )
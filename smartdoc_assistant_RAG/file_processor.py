@@ -13,58 +13,297 @@ License: MIT
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import BinaryIO, Callable, Dict, Optional
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from types import ModuleType
+from typing import TYPE_CHECKING, BinaryIO, Callable, Dict, Iterator, Optional, Tuple
 
-import PyPDF2
-from docx import Document
+if TYPE_CHECKING:
+    import PyPDF2
 
 # Logging configuration
 logger = logging.getLogger(__name__)
 
+# Extracted text is cached on disk by file content, one JSON line per page
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".smartdoc_cache")
+_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_CACHE_MAX_ENTRIES = 256
+
 # Helpers for each file type
 
 
-def _extract_pdf(file_obj: BinaryIO) -> str:
-    """Extract text from a PDF file object."""
-    reader = PyPDF2.PdfReader(file_obj)
-    text = "".join((page.extract_text() or "") + "\n" for page in reader.pages)
-    logger.info("PDF: extracted %s pages", len(reader.pages))
-    return text
+# The PDF and DOCX parsers are imported on first use so that starting the app,
+# or handling plain-text uploads, does not pay for loading them
+@lru_cache(maxsize=1)
+def _pypdf() -> ModuleType:
+    import PyPDF2
+
+    return PyPDF2
+
+
+# PDFium bindings extract text natively, several times faster than PyPDF2;
+# they are optional, and None means PyPDF2 is used instead
+@lru_cache(maxsize=1)
+def _pdfium() -> Optional[ModuleType]:
+    try:
+        import pypdfium2
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return pypdfium2
+
+
+@lru_cache(maxsize=1)
+def _docx() -> ModuleType:
+    import docx
+
+    return docx
+
+
+# PDFs shorter than this are extracted in-process; worker start-up would
+# cost more than it saves
+_PARALLEL_PDF_MIN_PAGES = 8
+
+# Per-worker reader, opened once by the pool initializer
+_worker_reader: Optional[PyPDF2.PdfReader] = None
+
+
+def _init_pdf_worker(data: bytes) -> None:
+    """Open the PDF once in each worker process."""
+    global _worker_reader
+    _worker_reader = _pypdf().PdfReader(BytesIO(data))
+
+
+def _extract_pdf_page(index: int) -> str:
+    """Extract one page in a worker process."""
+    return (_worker_reader.pages[index].extract_text() or "") + "\n"
+
+
+def _extract_pdf_pdfium(data: bytes) -> Iterator[str]:
+    """
+    Yield page texts using PDFium.
+
+    PDFium is not thread-safe, so pages are read one after another; the
+    native extractor is still several times faster than PyPDF2 per page.
+    """
+    pdf = _pdfium().PdfDocument(data)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range() + "\n"
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def _extract_pdf_pypdf2(data: bytes) -> Iterator[str]:
+    """Yield page texts using PyPDF2, across processes for long documents."""
+    reader = _pypdf().PdfReader(BytesIO(data))
+    num_pages = len(reader.pages)
+    workers = min(os.cpu_count() or 1, num_pages)
+
+    if num_pages < _PARALLEL_PDF_MIN_PAGES or workers < 2:
+        for page in reader.pages:
+            yield (page.extract_text() or "") + "\n"
+    else:
+        # Pages are independent and extraction is CPU-bound pure Python, so
+        # spread them over processes; map keeps the results in page order
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_pdf_worker, initargs=(data,)
+        ) as executor:
+            yield from executor.map(_extract_pdf_page, range(num_pages), chunksize=4)
 
 
-def _extract_docx(file_obj: BinaryIO) -> str:
-    """Extract text from a DOCX file object."""
-    doc = Document(file_obj)
-    text = "".join(p.text + "\n" for p in doc.paragraphs)
-    logger.info("DOCX: extracted %s paragraphs", len(doc.paragraphs))
-    return text
+def _extract_pdf(file_obj: BinaryIO) -> Iterator[str]:
+    """Yield the text of a PDF file object page by page."""
+    data = file_obj.read()
+    backend = _extract_pdf_pdfium if _pdfium() is not None else _extract_pdf_pypdf2
 
+    num_pages = 0
+    for page_text in backend(data):
+        num_pages += 1
+        yield page_text
 
-def _extract_txt(file_obj: BinaryIO) -> str:
-    """Extract text from a plain-text file object (UTF-8 with latin-1 fallback)."""
+    logger.info("PDF: extracted %s pages", num_pages)
+
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P = f"{_W_NS}p"
+_W_T = f"{_W_NS}t"
+_W_TAB = f"{_W_NS}tab"
+
+
+def _extract_docx(file_obj: BinaryIO) -> Iterator[str]:
+    """
+    Yield the text of a DOCX file object paragraph by paragraph.
+
+    The body XML is walked once with lxml's iterator instead of building a
+    python-docx Paragraph (and its runs) per paragraph; paragraphs inside
+    tables are included.
+    """
+    body = _docx().Document(file_obj).element.body
+    parts = []
+    paragraphs = 0
+
+    for element in body.iter(_W_P, _W_T, _W_TAB):
+        tag = element.tag
+        if tag == _W_T:
+            if element.text:
+                parts.append(element.text)
+        elif tag == _W_TAB:
+            parts.append("\t")
+        else:
+            if paragraphs:
+                yield "".join(parts) + "\n"
+                parts.clear()
+            paragraphs += 1
+
+    if paragraphs:
+        yield "".join(parts) + "\n"
+    logger.info("DOCX: extracted %s paragraphs", paragraphs)
+
+
+def _extract_txt(file_obj: BinaryIO) -> Iterator[str]:
+    """Yield the text of a plain-text file object (UTF-8, else detected encoding)."""
+    raw = file_obj.read()
     try:
-        content = file_obj.read().decode("utf-8")
+        content = raw.decode("utf-8")
         encoding = "utf-8"
     except UnicodeDecodeError:
-        content = file_obj.read().decode("latin-1", errors="ignore")
-        encoding = "latin-1"
+        from charset_normalizer import from_bytes
+
+        best = from_bytes(raw).best()
+        if best is not None:
+            content = str(best)
+            encoding = best.encoding
+        else:
+            content = raw.decode("latin-1", errors="replace")
+            encoding = "latin-1"
     logger.info("TXT: extracted using %s decoding", encoding)
-    return content
+    yield content
 
 
 # Dispatcher mapping mime-types → extractor
-_EXTRACTORS: Dict[str, Callable[[BinaryIO], str]] = {
+_EXTRACTORS: Dict[str, Callable[[BinaryIO], Iterator[str]]] = {
     "application/pdf": _extract_pdf,
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document": _extract_docx,
     "text/plain": _extract_txt,
 }
 
+# File signatures checked before the browser-provided MIME type, which can be
+# wrong or missing (DOCX files are ZIP archives)
+_MAGIC_EXTRACTORS: Tuple[Tuple[bytes, Callable[[BinaryIO], Iterator[str]]], ...] = (
+    (b"%PDF-", _extract_pdf),
+    (b"PK\x03\x04", _extract_docx),
+)
 
-# Public function
-def extract_text_from_file(uploaded_file: BinaryIO) -> Optional[str]:
+
+def _select_extractor(data: bytes, mime_type: str) -> Callable[[BinaryIO], Iterator[str]]:
+    """Pick the extractor from the file signature, else the MIME type, else plain text."""
+    for signature, extractor in _MAGIC_EXTRACTORS:
+        if data.startswith(signature):
+            return extractor
+    return _EXTRACTORS.get(mime_type, _extract_txt)
+
+
+def _logged(pieces: Iterator[str], mime_type: str) -> Iterator[str]:
+    """Pass extracted text through, logging a failure before it propagates."""
+    try:
+        yield from pieces
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Failed to extract text (%s): %s", mime_type, exc, exc_info=True)
+        raise
+
+
+def file_digest(data: bytes) -> str:
+    """Return the content hash used to key caches for an uploaded file."""
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(_CACHE_DIR, f"{key}.jsonl")
+
+
+def _iter_cached_text(key: str) -> Optional[Iterator[str]]:
+    """Return the cached pages for ``key``, or ``None`` on a miss."""
+    path = _cache_path(key)
+    try:
+        if time.time() - os.path.getmtime(path) > _CACHE_TTL_SECONDS:
+            os.remove(path)
+            return None
+        os.utime(path)  # Mark as recently used for eviction
+        cache_file = open(path, encoding="utf-8")
+    except OSError:
+        return None
+
+    def pages() -> Iterator[str]:
+        with cache_file:
+            for line in cache_file:
+                yield json.loads(line)
+
+    logger.info("Using cached text for %s", key)
+    return pages()
+
+
+def _evict_cached_text() -> None:
+    """Drop the least recently used entries beyond the cache size limit."""
+    entries = [entry for entry in os.scandir(_CACHE_DIR) if entry.name.endswith(".jsonl")]
+    if len(entries) <= _CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[: len(entries) - _CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _caching(pieces: Iterator[str], key: str) -> Iterator[str]:
     """
-    Extract raw text from an uploaded file.
+    Pass extracted text through while spooling it to the cache.
+
+    The entry is only published once extraction completes, so a failed or
+    abandoned extraction never leaves a partial document behind.
+    """
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        # Unique per extraction: sessions are threads of one process, so two
+        # of them may extract the same document at once
+        cache_file = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=_CACHE_DIR, prefix=f"{key}.", suffix=".tmp", delete=False
+        )
+    except OSError as exc:
+        logger.warning("Text cache unavailable: %s", exc)
+        yield from pieces
+        return
+
+    tmp_path = cache_file.name
+    try:
+        with cache_file:
+            for piece in pieces:
+                cache_file.write(json.dumps(piece))
+                cache_file.write("\n")
+                yield piece
+        os.replace(tmp_path, _cache_path(key))
+        _evict_cached_text()
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# Public functions
+def iter_text_from_file(uploaded_file: BinaryIO) -> Iterator[str]:
+    """
+    Lazily extract raw text from an uploaded file, one page or paragraph at a time.
 
     Parameters
     ----------
@@ -74,15 +313,11 @@ def extract_text_from_file(uploaded_file: BinaryIO) -> Optional[str]:
 
     Returns
     -------
-    Optional[str]
-        Extracted text or ``None`` if the type is unsupported or an error occurred.
+    Iterator[str]
+        Iterator over text pieces in document order. Extraction errors are
+        raised while iterating.
     """
     mime_type: str = getattr(uploaded_file, "type", "")
-    extractor = _EXTRACTORS.get(mime_type)
-
-    if extractor is None:
-        logger.warning("Unsupported file type: %s", mime_type)
-        return None
 
     # Reset pointer to start for safety
     try:
@@ -90,9 +325,56 @@ def extract_text_from_file(uploaded_file: BinaryIO) -> Optional[str]:
     except Exception:  # file-like objects without seek()
         pass
 
+    return iter_text_from_bytes(uploaded_file.read(), mime_type)
+
+
+def iter_text_from_bytes(data: bytes, mime_type: str) -> Iterator[str]:
+    """
+    Lazily extract raw text from file content of the given MIME type.
+
+    Parameters
+    ----------
+    data : bytes
+        Raw file content.
+    mime_type : str
+        Client-provided MIME type, used only when the content has no known
+        file signature. Anything unrecognised is read as plain text.
+
+    Returns
+    -------
+    Iterator[str]
+        Iterator over text pieces in document order. Extraction errors are
+        raised while iterating.
+    """
+    extractor = _select_extractor(data, mime_type)
+
+    # Re-uploads of the same content are served from the text cache
+    key = file_digest(data)
+    cached = _iter_cached_text(key)
+    if cached is not None:
+        return cached
+
+    pieces = _logged(extractor(BytesIO(data)), mime_type)
+    return _caching(pieces, key)
+
+
+def extract_text_from_file(uploaded_file: BinaryIO) -> Optional[str]:
+    """
+    Extract raw text from an uploaded file.
+
+    Parameters
+    ----------
+    uploaded_file : BinaryIO
+        Streamlit-style uploaded file object having `.type`, `.read()` and/or iterator
+        behaviour.
+
+    Returns
+    -------
+    Optional[str]
+        Extracted text or ``None`` if no text could be extracted.
+    """
     try:
-        text = extractor(uploaded_file)
-        return text if text.strip() else None
-    except Exception as exc:  # noqa: BLE001
-        logger.error("Failed to extract text (%s): %s", mime_type, exc, exc_info=True)
+        text = "".join(iter_text_from_file(uploaded_file))
+    except Exception:  # noqa: BLE001 - already logged by _logged
         return None
+    return text if text.strip() else None
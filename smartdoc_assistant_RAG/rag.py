@@ -9,20 +9,69 @@ Date: July 2025
 License: MIT
 """
 
+import inspect
+import json
 import os
 import logging
 import re
-from typing import List, Dict, Tuple, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional, Union
 
+import numpy as np
 import requests
 from dotenv import load_dotenv
-from sentence_transformers import SentenceTransformer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from vector_store import VectorDB
+try:  # orjson: several times faster JSON encoding/decoding of API payloads
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+from vector_store import VectorDB, as_float32, get_embedder
 
 # Load environment variables
 load_dotenv()
 
+# Model reasoning removed from responses before they are shown: thinking
+# blocks, thinking sections and thinking phrases, matched in one pass
+_THINKING_RE = re.compile(
+    r"<think>.*?</think>"
+    r"|\[THINKING\].*?\[/THINKING\]"
+    r"|Let me think about this.*?\n\n",
+    re.DOTALL | re.IGNORECASE,
+)
+_EXCESS_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+# Sent with every request, so it is built once and without the source
+# indentation, which would otherwise be paid for in tokens on each turn
+_SYSTEM_PROMPT = inspect.cleandoc(
+    """
+    You are a helpful AI assistant that answers questions based on the provided document context.
+
+    IMPORTANT RULES:
+    - ONLY use information from the "Context from document" section
+    - If the document context doesn't contain the answer, clearly state this
+    - Be specific and cite relevant parts of the document
+    - Do not include <think> tags or reasoning steps in your response
+    - Provide a report or summary based on the conversation so far when user asks
+    - Be polite and build friendly conversation.
+
+    Respond naturally to the user's question. If you find relevant information in the document, use it. If not, or if you need more current information, search the web. Be conversational and helpful.
+    """
+)
+
+if orjson is not None:
+    _dumps_json, _loads_json = orjson.dumps, orjson.loads
+else:
+
+    def _dumps_json(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads_json = json.loads
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
 # Configure logging with proper formatting
 logging.basicConfig(
     level=logging.INFO,
@@ -46,6 +95,23 @@ class EnhancedRAG:
     API_TIMEOUT = 60
     DEFAULT_MODEL = "sonar"
 
+    # Perplexity calls in flight at once across all sessions, and retries for
+    # rate limiting and server errors (honouring Retry-After)
+    MAX_CONCURRENT_REQUESTS = 5
+    API_RETRIES = 3
+    API_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Fallback replies returned when no answer could be generated
+    API_ERROR_RESPONSE = "Sorry, I encountered an error while generating the response."
+    UNEXPECTED_ERROR_RESPONSE = "Sorry, I encountered an unexpected error. Please try again."
+    ERROR_RESPONSES = frozenset({API_ERROR_RESPONSE, UNEXPECTED_ERROR_RESPONSE})
+
+    # Built indexes are kept on disk by document hash, least recently used
+    # dropped first once the directory outgrows INDEX_DIR_MAX_BYTES
+    INDEX_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".indexes")
+    INDEX_DIR_MAX_BYTES = 1 << 30
+    INDEX_MIN_CHUNKS_TO_SAVE = 16  # Smaller documents re-embed in well under a second
+
     def __init__(self) -> None:
         """
         Initialize the Enhanced RAG system.
@@ -57,14 +123,14 @@ class EnhancedRAG:
         self.logger.info("Initializing EnhancedRAG system...")
 
         try:
+            # Initialize local embedding model, shared by every document index
+            self.embedding_model = get_embedder(VectorDB.DEFAULT_MODEL_NAME)
+            self.logger.debug("Embedding model loaded successfully")
+
             # Initialize vector database for document storage
-            self.vector_db = VectorDB()
+            self.vector_db = self.new_document_index()
             self.logger.debug("Vector database initialized successfully")
 
-            # Initialize local embedding model (kept for potential future use)
-            self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-            self.logger.debug("Embedding model loaded successfully")
-
             # Initialize legacy attributes for backward compatibility
             self.index = None
             self.chunks = []
@@ -94,8 +160,67 @@ class EnhancedRAG:
             raise ValueError("Please set PERPLEXITY_API_KEY environment variable")
 
         self.perplexity_url = self.PERPLEXITY_API_URL
+
+        # One pooled session keeps connections alive between chat turns
+        retry = Retry(
+            total=self.API_RETRIES,
+            status_forcelist=self.API_RETRY_STATUSES,
+            allowed_methods=frozenset({"POST"}),
+            backoff_factor=1,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._http = requests.Session()
+        self._http.headers.update(
+            {
+                "Authorization": f"Bearer {self.perplexity_api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+        self._http.mount(
+            "https://",
+            HTTPAdapter(max_retries=retry, pool_maxsize=self.MAX_CONCURRENT_REQUESTS),
+        )
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+
         self.logger.debug("Perplexity API configuration completed")
 
+    def new_document_index(self) -> VectorDB:
+        """
+        Create an empty document index that shares this system's embedding model.
+
+        A single EnhancedRAG can serve many users; each keeps its own index
+        and passes it to build_index, retrieve_context, chat and reset_index.
+
+        Returns:
+            VectorDB: Empty vector database
+        """
+        return VectorDB(embedding_model=self.embedding_model)
+
+    def _resolve_index(self, vector_db: Optional[VectorDB]) -> VectorDB:
+        """Return the given index, or the built-in one when none is passed."""
+        # VectorDB is falsy until indexed, so compare against None explicitly
+        return self.vector_db if vector_db is None else vector_db
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed text with the shared model as a unit-length vector.
+
+        Args:
+            text (str): Text to embed
+
+        Returns:
+            np.ndarray: Normalized float32 embedding, so dot products are cosines
+        """
+        return as_float32(
+            self.embedding_model.encode(
+                text,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+        )
+
     def chunk_text(self, text: str) -> None:
         """
         Delegate text chunking to the vector database.
@@ -106,29 +231,107 @@ class EnhancedRAG:
         self.logger.debug("Delegating text chunking to vector database")
         self.vector_db.chunk_text(text)
 
-    def build_index(self, text: str) -> None:
+    def build_index(
+        self, text: Union[str, Iterable[str]], vector_db: Optional[VectorDB] = None
+    ) -> None:
         """
         Build document index using the vector database.
 
         Args:
-            text (str): Document text to be indexed
+            text (Union[str, Iterable[str]]): Document text, or its pages in order
+            vector_db (Optional[VectorDB]): Index to build, defaults to the built-in one
         """
         self.logger.info("Building document index...")
 
         try:
-            self.vector_db.build_index(text)
+            self._resolve_index(vector_db).build_index(text)
             self.logger.info("Document index built successfully")
 
         except Exception as e:
             self.logger.error(f"Failed to build document index: {e}")
             raise
 
-    def retrieve_context(self, query: str) -> List[str]:
+    def save_index(self, doc_hash: str, vector_db: Optional[VectorDB] = None) -> None:
+        """
+        Persist a built document index so the same document is not embedded again.
+
+        Failures are logged and otherwise ignored; the index stays usable in memory.
+
+        Args:
+            doc_hash (str): Content hash of the indexed document
+            vector_db (Optional[VectorDB]): Index to save, defaults to the built-in one
+        """
+        index = self._resolve_index(vector_db)
+        if len(index) < self.INDEX_MIN_CHUNKS_TO_SAVE:
+            self.logger.debug("Document index too small to persist")
+            return
+
+        try:
+            os.makedirs(self.INDEX_DIR, exist_ok=True)
+            index.save(os.path.join(self.INDEX_DIR, doc_hash))
+            self._evict_indexes()
+        except Exception as e:
+            self.logger.warning(f"Could not persist document index: {e}")
+
+    def load_index(self, doc_hash: str, vector_db: Optional[VectorDB] = None) -> bool:
+        """
+        Load a previously saved index for a document instead of rebuilding it.
+
+        Args:
+            doc_hash (str): Content hash of the document
+            vector_db (Optional[VectorDB]): Index to load into, defaults to the built-in one
+
+        Returns:
+            bool: True if a saved index was loaded
+        """
+        path = os.path.join(self.INDEX_DIR, doc_hash)
+        if not self._resolve_index(vector_db).load(path):
+            return False
+
+        # Mark as recently used for eviction
+        for extension in (".faiss", ".json"):
+            try:
+                os.utime(path + extension)
+            except OSError:
+                pass
+        self.logger.info("Loaded saved document index")
+        return True
+
+    def _evict_indexes(self) -> None:
+        """Drop the least recently used saved indexes beyond the size limit."""
+        entries: Dict[str, List[os.DirEntry]] = {}
+        for entry in os.scandir(self.INDEX_DIR):
+            if entry.name.endswith((".faiss", ".json")):
+                entries.setdefault(os.path.splitext(entry.name)[0], []).append(entry)
+
+        total = sum(entry.stat().st_size for group in entries.values() for entry in group)
+        by_age = sorted(
+            entries.values(), key=lambda group: max(entry.stat().st_mtime for entry in group)
+        )
+        for group in by_age:
+            if total <= self.INDEX_DIR_MAX_BYTES:
+                break
+            for entry in group:
+                try:
+                    total -= entry.stat().st_size
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def retrieve_context(
+        self,
+        query: str,
+        vector_db: Optional[VectorDB] = None,
+        query_embedding: Optional[np.ndarray] = None,
+    ) -> List[str]:
         """
         Retrieve relevant document chunks for a given query.
 
         Args:
             query (str): User query to search for relevant context
+            vector_db (Optional[VectorDB]): Index to search, defaults to the built-in one
+            query_embedding (Optional[np.ndarray]): The query's embedding from
+                :meth:`embed`, if already computed, so it is not embedded again
 
         Returns:
             List[str]: List of relevant document chunks
@@ -136,7 +339,9 @@ class EnhancedRAG:
         self.logger.debug(f"Retrieving context for query: '{query[:50]}...'")
 
         try:
-            context_chunks = self.vector_db.retrieve(query)
+            context_chunks = self._resolve_index(vector_db).retrieve(
+                query, query_embedding=query_embedding
+            )
             self.logger.debug(f"Retrieved {len(context_chunks)} context chunks")
             return context_chunks
 
@@ -159,22 +364,12 @@ class EnhancedRAG:
 
         try:
             # Remove thinking blocks and reasoning patterns
-            patterns_to_remove = [
-                (r"<think>.*?</think>", "thinking blocks"),
-                (r"\[THINKING\].*?\[/THINKING\]", "thinking sections"),
-                (r"Let me think about this.*?\n\n", "thinking phrases"),
-            ]
-
-            cleaned = response
-            for pattern, description in patterns_to_remove:
-                original_length = len(cleaned)
-                cleaned = re.sub(pattern, "", cleaned, flags=re.DOTALL | re.IGNORECASE)
-
-                if len(cleaned) < original_length:
-                    self.logger.debug(f"Removed {description} from response")
+            cleaned, removed = _THINKING_RE.subn("", response)
+            if removed:
+                self.logger.debug("Removed %s thinking passages from response", removed)
 
             # Clean up excessive whitespace
-            cleaned = re.sub(r"\n\s*\n\s*\n", "\n\n", cleaned)
+            cleaned = _EXCESS_BLANK_LINES_RE.sub("\n\n", cleaned)
             cleaned = cleaned.strip()
 
             return cleaned
@@ -190,21 +385,7 @@ class EnhancedRAG:
         Returns:
             Dict[str, str]: System message configuration
         """
-        return {
-            "role": "system",
-            "content": """You are a helpful AI assistant that answers questions based on the provided document context.
-            
-            IMPORTANT RULES:
-            - ONLY use information from the "Context from document" section
-            - If the document context doesn't contain the answer, clearly state this
-            - Be specific and cite relevant parts of the document
-            - Do not include <think> tags or reasoning steps in your response
-            - Provide a report or summary based on the conversation so far when user asks
-            - Be polite and build friendly conversation.
-            
-            Respond naturally to the user's question. If you find relevant information in the document, use it. If not, or if you need more current information, search the web. Be conversational and helpful.
-            """,
-        }
+        return {"role": "system", "content": _SYSTEM_PROMPT}
 
     def _build_conversation_messages(
         self, query: str, context: List[str], chat_history: List[Dict]
@@ -222,14 +403,9 @@ class EnhancedRAG:
         """
         messages = [self._build_system_message()]
 
-        # Add recent chat history (last 10 messages)
-        recent_history = (
-            chat_history[-self.MAX_CHAT_HISTORY :]
-            if len(chat_history) > self.MAX_CHAT_HISTORY
-            else chat_history
-        )
-
-        for entry in recent_history:
+        # Add recent chat history (last 10 messages); slicing a shorter
+        # history simply returns all of it
+        for entry in chat_history[-self.MAX_CHAT_HISTORY :]:
             if isinstance(entry, dict) and "role" in entry and "content" in entry:
                 messages.append(
                     {
@@ -247,14 +423,11 @@ class EnhancedRAG:
             self.logger.debug("No document context available")
 
         # Add current query with context
-        current_message = f"""Context from document:
-        {context_text}
-
-
-        Question: {query}
-
-
-        Provide a clean, direct response without showing thinking steps."""
+        current_message = (
+            f"Context from document:\n{context_text}\n\n"
+            f"Question: {query}\n\n"
+            "Provide a clean, direct response without showing thinking steps."
+        )
 
         messages.append({"role": "user", "content": current_message})
 
@@ -277,17 +450,7 @@ class EnhancedRAG:
         self.logger.info("Generating AI response...")
 
         try:
-            # Build conversation messages
-            messages = self._build_conversation_messages(query, context, chat_history)
-
-            # Prepare API request payload
-            payload = {
-                "model": self.DEFAULT_MODEL,
-                "messages": messages,
-                "max_tokens": 1000,
-                "temperature": 0.1,
-                "top_p": 0.9,
-            }
+            payload = self._build_payload(query, context, chat_history)
 
             # Make API request
             self.logger.debug("Sending request to Perplexity API...")
@@ -295,18 +458,154 @@ class EnhancedRAG:
 
             if response:
                 # Extract and clean response
-                raw_response = response.json()["choices"][0]["message"]["content"]
+                raw_response = _loads_json(response.content)["choices"][0]["message"][
+                    "content"
+                ]
                 cleaned_response = self.clean_response(raw_response)
 
                 self.logger.info("AI response generated and cleaned successfully")
                 return cleaned_response
             else:
-                return "Sorry, I encountered an error while generating the response."
+                return self.API_ERROR_RESPONSE
 
         except Exception as e:
             error_msg = f"Unexpected error in response generation: {e}"
             self.logger.error(error_msg)
-            return "Sorry, I encountered an unexpected error. Please try again."
+            return self.UNEXPECTED_ERROR_RESPONSE
+
+    def generate_response_stream(
+        self, query: str, context: List[str], chat_history: List[Dict]
+    ) -> Iterator[str]:
+        """
+        Generate an AI response as text pieces while Perplexity streams it.
+
+        <think> blocks are left out as they arrive; the joined text should
+        still be passed through :meth:`clean_response`. If no answer could be
+        generated, the stream ends with one of ERROR_RESPONSES.
+
+        Args:
+            query (str): User query
+            context (List[str]): Retrieved document context
+            chat_history (List[Dict]): Conversation history
+
+        Yields:
+            str: Response text as it is received
+        """
+        self.logger.info("Streaming AI response...")
+        payload = self._build_payload(query, context, chat_history)
+        payload["stream"] = True
+        emitted = False
+
+        try:
+            with self._request_slots, self._http.post(
+                self.perplexity_url,
+                data=_dumps_json(payload),
+                timeout=self.API_TIMEOUT,
+                stream=True,
+            ) as response:
+                if response.status_code != 200:
+                    self.logger.error(f"API Error {response.status_code}: {response.text}")
+                    yield self.API_ERROR_RESPONSE
+                    return
+
+                for piece in self._strip_thinking_stream(self._iter_sse_content(response)):
+                    if piece:
+                        emitted = True
+                        yield piece
+
+            if not emitted:
+                yield self.API_ERROR_RESPONSE
+            self.logger.info("AI response streamed successfully")
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"API stream failed: {e}")
+            yield ("\n\n" if emitted else "") + self.API_ERROR_RESPONSE
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error in response streaming: {e}")
+            yield ("\n\n" if emitted else "") + self.UNEXPECTED_ERROR_RESPONSE
+
+    @staticmethod
+    def _iter_sse_content(response: requests.Response) -> Iterator[str]:
+        """Yield the content deltas of an OpenAI-style server-sent event stream."""
+        # Lines stay bytes: event streams are UTF-8, but requests decodes a
+        # text/event-stream without a charset as ISO-8859-1
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            choices = _loads_json(data).get("choices") or ()
+            if choices:
+                content = (choices[0].get("delta") or {}).get("content")
+                if content:
+                    yield content
+
+    @staticmethod
+    def _strip_thinking_stream(pieces: Iterable[str]) -> Iterator[str]:
+        """
+        Pass streamed text through, dropping <think>...</think> blocks.
+
+        Text that might be the start of a tag is held back until the next
+        piece shows whether it is one.
+        """
+        pending = ""
+        thinking = False
+
+        for piece in pieces:
+            pending += piece
+            while pending:
+                if thinking:
+                    end = pending.lower().find(_THINK_CLOSE)
+                    if end < 0:
+                        # Keep only what could be the start of the closing tag
+                        pending = pending[-(len(_THINK_CLOSE) - 1) :]
+                        break
+                    pending = pending[end + len(_THINK_CLOSE) :]
+                    thinking = False
+                else:
+                    start = pending.lower().find(_THINK_OPEN)
+                    if start >= 0:
+                        yield pending[:start]
+                        pending = pending[start + len(_THINK_OPEN) :]
+                        thinking = True
+                        continue
+
+                    # Hold back a trailing partial "<think>"
+                    held = 0
+                    for size in range(min(len(_THINK_OPEN) - 1, len(pending)), 0, -1):
+                        if _THINK_OPEN.startswith(pending[-size:].lower()):
+                            held = size
+                            break
+                    yield pending[: len(pending) - held]
+                    pending = pending[len(pending) - held :]
+                    break
+
+        if pending and not thinking:
+            yield pending
+
+    def _build_payload(
+        self, query: str, context: List[str], chat_history: List[Dict]
+    ) -> Dict:
+        """
+        Build the Perplexity chat completion request payload.
+
+        Args:
+            query (str): User query
+            context (List[str]): Retrieved document context
+            chat_history (List[Dict]): Conversation history
+
+        Returns:
+            Dict: Request payload
+        """
+        return {
+            "model": self.DEFAULT_MODEL,
+            "messages": self._build_conversation_messages(query, context, chat_history),
+            "max_tokens": 1000,
+            "temperature": 0.1,
+            "top_p": 0.9,
+        }
 
     def _make_api_request(self, payload: Dict) -> Optional[requests.Response]:
         """
@@ -318,18 +617,13 @@ class EnhancedRAG:
         Returns:
             Optional[requests.Response]: API response object or None if failed
         """
-        headers = {
-            "Authorization": f"Bearer {self.perplexity_api_key}",
-            "Content-Type": "application/json",
-        }
-
         try:
-            response = requests.post(
-                self.perplexity_url,
-                headers=headers,
-                json=payload,
-                timeout=self.API_TIMEOUT,
-            )
+            with self._request_slots:
+                response = self._http.post(
+                    self.perplexity_url,
+                    data=_dumps_json(payload),
+                    timeout=self.API_TIMEOUT,
+                )
 
             # Check for successful response
             if response.status_code == 200:
@@ -348,27 +642,36 @@ class EnhancedRAG:
             self.logger.error(f"API request failed: {e}")
             return None
 
-    def reset_index(self) -> None:
+    def reset_index(self, vector_db: Optional[VectorDB] = None) -> None:
         """
         Reset the vector database index for processing a new document.
+
+        Args:
+            vector_db (Optional[VectorDB]): Index to reset, defaults to the built-in one
         """
         self.logger.info("Resetting document index...")
 
         try:
-            self.vector_db.reset()
+            self._resolve_index(vector_db).reset()
             self.logger.info("Document index reset successfully")
 
         except Exception as e:
             self.logger.error(f"Error resetting index: {e}")
             raise
 
-    def chat(self, query: str, chat_history: List[Dict]) -> Tuple[str, List[Dict]]:
+    def chat(
+        self,
+        query: str,
+        chat_history: List[Dict],
+        vector_db: Optional[VectorDB] = None,
+    ) -> Tuple[str, List[Dict]]:
         """
         Main chat function for processing user queries and maintaining conversation.
 
         Args:
             query (str): User input query
             chat_history (List[Dict]): Previous conversation messages
+            vector_db (Optional[VectorDB]): Document index, defaults to the built-in one
 
         Returns:
             Tuple[str, List[Dict]]: AI response and updated chat history
@@ -381,19 +684,16 @@ class EnhancedRAG:
 
         try:
             # Retrieve relevant context from document
-            context = self.retrieve_context(query)
+            context = self.retrieve_context(query, vector_db)
 
             # Generate AI response
             response = self.generate_response(query, context, chat_history)
 
-            # Update conversation history
-            updated_history = chat_history.copy()
-            updated_history.extend(
-                [
-                    {"role": "user", "content": query},
-                    {"role": "assistant", "content": response},
-                ]
-            )
+            # Update conversation history in a single concatenation
+            updated_history = chat_history + [
+                {"role": "user", "content": query},
+                {"role": "assistant", "content": response},
+            ]
 
             self.logger.info("Chat interaction completed successfully")
             return response, updated_history
@@ -405,3 +705,76 @@ class EnhancedRAG:
                 "I apologize, but I encountered an error. Please try again.",
                 chat_history,
             )
+
+    def chat_stream(
+        self,
+        query: str,
+        chat_history: List[Dict],
+        vector_db: Optional[VectorDB] = None,
+        query_embedding: Optional[np.ndarray] = None,
+    ) -> Iterator[str]:
+        """
+        Answer a query, yielding the response text as it is generated.
+
+        Unlike :meth:`chat`, the history is left to the caller, which can
+        append the exchange once the stream is exhausted.
+
+        Args:
+            query (str): User input query
+            chat_history (List[Dict]): Previous conversation messages
+            vector_db (Optional[VectorDB]): Document index, defaults to the built-in one
+            query_embedding (Optional[np.ndarray]): The query's embedding from
+                :meth:`embed`, if the caller already computed it
+
+        Yields:
+            str: Response text as it is received
+        """
+        self.logger.info(f"Processing chat query: '{query[:50]}...'")
+
+        context = self.retrieve_context(query, vector_db, query_embedding)
+        yield from self.generate_response_stream(query, context, chat_history)
+
+    def batch_chat(
+        self,
+        queries: List[str],
+        chat_history: List[Dict],
+        vector_db: Optional[VectorDB] = None,
+    ) -> List[str]:
+        """
+        Answer several independent queries against the same conversation.
+
+        Context for all queries is retrieved in one batch, and the API calls
+        run concurrently, bounded by MAX_CONCURRENT_REQUESTS.
+
+        Args:
+            queries (List[str]): User queries
+            chat_history (List[Dict]): Previous conversation messages
+            vector_db (Optional[VectorDB]): Document index, defaults to the built-in one
+
+        Returns:
+            List[str]: AI responses, in query order
+        """
+        if not queries:
+            return []
+
+        self.logger.info(f"Processing {len(queries)} chat queries")
+
+        index = self._resolve_index(vector_db)
+        try:
+            contexts = index.retrieve_batch(queries) if index else [[] for _ in queries]
+        except Exception as e:
+            self.logger.error(f"Error retrieving context: {e}")
+            contexts = [[] for _ in queries]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_CONCURRENT_REQUESTS, len(queries))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda query, context: self.generate_response(
+                        query, context, chat_history
+                    ),
+                    queries,
+                    contexts,
+                )
+            )
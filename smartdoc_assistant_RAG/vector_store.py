@@ -11,8 +11,15 @@ Date: July 2025
 License: MIT
 """
 
+import json
 import logging
-from typing import List, Optional
+import os
+import re
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Union
 import numpy as np
 
 import faiss
@@ -21,6 +28,44 @@ from sentence_transformers import SentenceTransformer
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\S+")
+
+
+@lru_cache(maxsize=None)
+def get_embedder(model_name: str) -> SentenceTransformer:
+    """
+    Return the process-wide SentenceTransformer for ``model_name``.
+
+    Every VectorDB and EnhancedRAG using the same model shares one copy of
+    its weights. SMARTDOC_EMBEDDING_BACKEND=onnx|openvino selects an optimized
+    inference backend (needs the matching sentence-transformers extra); the
+    default PyTorch model runs in half precision on a GPU.
+
+    Args:
+        model_name (str): Name of the SentenceTransformer model
+
+    Returns:
+        SentenceTransformer: Loaded embedding model
+    """
+    backend = os.getenv("SMARTDOC_EMBEDDING_BACKEND", "torch").lower()
+    logger.info(f"Loading embedding model: {model_name} ({backend})")
+
+    if backend != "torch":
+        try:
+            return SentenceTransformer(model_name, backend=backend)
+        except Exception as e:
+            logger.warning(f"Embedding backend '{backend}' unavailable, using torch: {e}")
+
+    model = SentenceTransformer(model_name)
+    if model.device.type == "cuda":
+        model.half()
+    return model
+
+
+def as_float32(array: np.ndarray) -> np.ndarray:
+    """Return ``array`` as contiguous float32, without copying when it already is."""
+    return np.ascontiguousarray(array, dtype=np.float32)
+
 
 class VectorDBError(Exception):
     """Custom exception for VectorDB-specific errors."""
@@ -43,12 +88,41 @@ class VectorDB:
     MIN_CHUNK_LENGTH = 10  # Minimum characters for a valid chunk
     MAX_CHUNK_SIZE = 2000  # Maximum chunk size for memory efficiency
 
-    def __init__(self, model_name: str = DEFAULT_MODEL_NAME) -> None:
+    # Retrieval results are cached per query; a new query whose embedding is
+    # this close to a cached one reuses its results
+    QUERY_CACHE_SIZE = 256
+    QUERY_CACHE_THRESHOLD = 0.95
+
+    ENCODE_BATCH_SIZE = 64  # Texts per embedding forward pass
+
+    # Documents with at least this many chunks are embedded by a pool of
+    # worker processes; below it, starting the workers (each loading the
+    # model) costs more than it saves
+    MULTI_PROCESS_MIN_CHUNKS = 1024
+
+    # Documents with at least HNSW_MIN_CHUNKS chunks get an HNSW graph index
+    # instead of an exact flat scan, and beyond IVF_MIN_CHUNKS an inverted-file
+    # index storing float16 vectors; VECTORDB_INDEX_KIND=flat|hnsw|ivf overrides
+    HNSW_MIN_CHUNKS = 2000
+    HNSW_NEIGHBORS = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+    IVF_MIN_CHUNKS = 5000
+    IVF_CHUNKS_PER_LIST = 100
+    IVF_NPROBE = 8
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        embedding_model: Optional[SentenceTransformer] = None,
+    ) -> None:
         """
         Initialize VectorDB with specified embedding model.
 
         Args:
             model_name (str): Name of the SentenceTransformer model to use
+            embedding_model (Optional[SentenceTransformer]): Already loaded model
+                to share instead of loading ``model_name`` again
 
         Raises:
             VectorDBError: If model initialization fails
@@ -57,13 +131,23 @@ class VectorDB:
         self.embedding_dimension: Optional[int] = None
         self.index: Optional[faiss.Index] = None
         self.chunks: List[str] = []
+        self.word_count = 0
+        self.char_count = 0
         self.is_indexed = False
 
+        # (normalized query, top_k, threshold) -> (query embedding, chunks)
+        self._query_cache: OrderedDict = OrderedDict()
+
         logger.info(f"Initializing VectorDB with model: {model_name}")
 
+        if embedding_model is not None:
+            self.embedding_model = embedding_model
+            logger.debug("Using shared embedding model: %s", model_name)
+            return
+
         try:
-            # Initialize embedding model
-            self.embedding_model = SentenceTransformer(model_name)
+            # Initialize embedding model, shared with other instances
+            self.embedding_model = get_embedder(model_name)
             logger.info(f"Successfully loaded embedding model: {model_name}")
 
         except Exception as e:
@@ -134,30 +218,37 @@ class VectorDB:
             self._validate_text_input(text)
             self._validate_chunk_parameters(chunk_size, overlap)
 
-            # Split text into words
-            words = text.split()
-            total_words = len(words)
+            # Locate words by character offset; chunks are then slices of the
+            # original text, with no word lists to build and join
+            spans = np.fromiter(
+                chain.from_iterable(match.span() for match in _WORD_RE.finditer(text)),
+                dtype=np.int64,
+            ).reshape(-1, 2)
+            total_words = len(spans)
+            self.word_count = total_words
+            self.char_count = len(text)
 
             if total_words <= chunk_size:
                 logger.info(f"Text has {total_words} words, creating single chunk")
                 return [text.strip()]
 
-            # Create overlapping chunks
-            chunks = []
+            # Create overlapping chunks, stopping at the first one that
+            # reaches the last word
             step_size = chunk_size - overlap
-
-            for i in range(0, total_words, step_size):
-                # Extract chunk words
-                chunk_words = words[i : i + chunk_size]
-                chunk_text = " ".join(chunk_words).strip()
-
-                # Only add non-empty chunks with sufficient content
-                if len(chunk_text) >= self.MIN_CHUNK_LENGTH:
-                    chunks.append(chunk_text)
-
-                # Stop if we've reached the end
-                if i + chunk_size >= total_words:
-                    break
+            first_words = np.arange(0, total_words, step_size)
+            first_words = first_words[
+                : np.searchsorted(first_words, total_words - chunk_size) + 1
+            ]
+            last_words = np.minimum(first_words + chunk_size, total_words) - 1
+
+            # Only keep chunks with sufficient content
+            chunks = [
+                text[start:end]
+                for start, end in zip(
+                    spans[first_words, 0].tolist(), spans[last_words, 1].tolist()
+                )
+                if end - start >= self.MIN_CHUNK_LENGTH
+            ]
 
             logger.info(f"Created {len(chunks)} text chunks from {total_words} words")
             return chunks
@@ -169,24 +260,107 @@ class VectorDB:
             logger.error(error_msg)
             raise VectorDBError(error_msg) from e
 
+    @staticmethod
+    def _iter_word_chunks(
+        word_groups: Iterable[List[str]], chunk_size: int, overlap: int
+    ) -> Iterator[str]:
+        """
+        Yield overlapping word chunks from words arriving in groups.
+
+        Only the current window of words is held, so a document can be
+        chunked while it is still being extracted.
+        """
+        step_size = chunk_size - overlap
+        window: List[str] = []
+
+        for words in word_groups:
+            window.extend(words)
+
+            # A full chunk is final once words beyond it have arrived
+            while len(window) > chunk_size:
+                yield " ".join(window[:chunk_size]).strip()
+                del window[:step_size]
+
+        if window:
+            yield " ".join(window).strip()
+
+    def _chunk_stream(
+        self, pieces: Iterable[str], chunk_size: int, overlap: int
+    ) -> List[str]:
+        """
+        Chunk text supplied as an iterable of pieces (e.g. pages).
+
+        Pieces must break on whitespace, as pages and paragraphs do. The words
+        and characters are counted as they are split, so callers can read
+        ``word_count`` and ``char_count`` instead of going over the document again.
+        """
+        self._validate_chunk_parameters(chunk_size, overlap)
+        self.word_count = 0
+        self.char_count = 0
+
+        def word_groups() -> Iterator[List[str]]:
+            for piece in pieces:
+                words = piece.split()
+                self.word_count += len(words)
+                self.char_count += len(piece)
+                yield words
+
+        chunks = [
+            chunk
+            for chunk in self._iter_word_chunks(word_groups(), chunk_size, overlap)
+            if len(chunk) >= self.MIN_CHUNK_LENGTH
+        ]
+        logger.info(
+            "Created %s text chunks from %s streamed words", len(chunks), self.word_count
+        )
+        return chunks
+
     def _create_faiss_index(self, embeddings: np.ndarray) -> faiss.Index:
         """
         Create and configure FAISS index for similarity search.
 
         """
         try:
-            dimension = embeddings.shape[1]
-
-            # Create inner product index for cosine similarity (after normalization)
-            index = faiss.IndexFlatIP(dimension)
-
-            # Normalize embeddings for proper cosine similarity
-            faiss.normalize_L2(embeddings)
+            count, dimension = embeddings.shape
+            index_kind = os.getenv("VECTORDB_INDEX_KIND", "auto").lower()
+            if index_kind == "auto":
+                if count > self.IVF_MIN_CHUNKS:
+                    index_kind = "ivf"
+                elif count >= self.HNSW_MIN_CHUNKS:
+                    index_kind = "hnsw"
+                else:
+                    index_kind = "flat"
+
+            embeddings = as_float32(embeddings)
+
+            # Create inner product index; embeddings are unit length, so
+            # inner products are cosine similarities
+            if index_kind == "ivf":
+                # Half-precision storage halves memory and the data scanned
+                # per probed list
+                quantizer = faiss.IndexFlatIP(dimension)
+                index = faiss.IndexIVFScalarQuantizer(
+                    quantizer,
+                    dimension,
+                    max(1, count // self.IVF_CHUNKS_PER_LIST),
+                    faiss.ScalarQuantizer.QT_fp16,
+                    faiss.METRIC_INNER_PRODUCT,
+                )
+                index.train(embeddings)
+                index.nprobe = self.IVF_NPROBE
+            elif index_kind == "hnsw":
+                index = faiss.IndexHNSWFlat(
+                    dimension, self.HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT
+                )
+                index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+                index.hnsw.efSearch = self.HNSW_EF_SEARCH
+            else:
+                index = faiss.IndexFlatIP(dimension)
 
             # Add embeddings to index
-            index.add(embeddings.astype("float32"))
+            index.add(embeddings)
 
-            logger.debug(f"Created FAISS index with dimension {dimension}")
+            logger.debug(f"Created {index_kind} FAISS index with dimension {dimension}")
             return index
 
         except Exception as e:
@@ -196,7 +370,7 @@ class VectorDB:
 
     def build_index(
         self,
-        text: str,
+        text: Union[str, Iterable[str]],
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         overlap: int = DEFAULT_OVERLAP,
     ) -> None:
@@ -204,7 +378,8 @@ class VectorDB:
         Build FAISS index from document text with comprehensive error handling.
 
         This method performs one-time indexing of the document text, creating
-        chunks and building the vector index for efficient retrieval.
+        chunks and building the vector index for efficient retrieval. The text
+        may also be an iterable of pieces, which is chunked as it is consumed.
 
         """
         if self.is_indexed:
@@ -215,7 +390,10 @@ class VectorDB:
 
         try:
             # Create text chunks
-            self.chunks = self.chunk_text(text, chunk_size, overlap)
+            if isinstance(text, str):
+                self.chunks = self.chunk_text(text, chunk_size, overlap)
+            else:
+                self.chunks = self._chunk_stream(text, chunk_size, overlap)
 
             if not self.chunks:
                 raise VectorDBError("No valid chunks created from input text")
@@ -224,18 +402,15 @@ class VectorDB:
 
             # Generate embeddings for all chunks
             logger.debug("Generating embeddings for text chunks...")
-            embeddings = self.embedding_model.encode(
-                self.chunks, show_progress_bar=False, convert_to_numpy=True
-            )
-
-            # Store embedding dimension
-            self.embedding_dimension = embeddings.shape[1]
+            embeddings = self._encode_chunks(self.chunks)
 
-            # Create and populate FAISS index
+            # Create and populate FAISS index, keeping its dimension
             self.index = self._create_faiss_index(embeddings)
+            self.embedding_dimension = self.index.d
 
-            # Mark as successfully indexed
+            # Mark as successfully indexed; cached results belong to the old index
             self.is_indexed = True
+            self._query_cache.clear()
 
             logger.info(
                 f"FAISS index built successfully with {self.index.ntotal} vectors"
@@ -253,6 +428,37 @@ class VectorDB:
             logger.error(error_msg)
             raise VectorDBError(error_msg) from e
 
+    def _encode_chunks(self, chunks: List[str]) -> np.ndarray:
+        """
+        Embed document chunks as unit-length rows, across processes for large documents.
+
+        Args:
+            chunks (List[str]): Chunks to embed
+
+        Returns:
+            np.ndarray: One embedding per chunk
+        """
+        if len(chunks) >= self.MULTI_PROCESS_MIN_CHUNKS and (os.cpu_count() or 1) > 1:
+            logger.info(f"Encoding {len(chunks)} chunks with a process pool")
+            pool = self.embedding_model.start_multi_process_pool()
+            try:
+                return self.embedding_model.encode_multi_process(
+                    chunks,
+                    pool,
+                    batch_size=self.ENCODE_BATCH_SIZE,
+                    normalize_embeddings=True,
+                )
+            finally:
+                self.embedding_model.stop_multi_process_pool(pool)
+
+        return self.embedding_model.encode(
+            chunks,
+            batch_size=self.ENCODE_BATCH_SIZE,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+
     def _cleanup_failed_index(self) -> None:
         """Clean up resources after failed index creation."""
         self.index = None
@@ -287,12 +493,15 @@ class VectorDB:
         query: str,
         top_k: int = DEFAULT_TOP_K,
         threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        query_embedding: Optional[np.ndarray] = None,
     ) -> List[str]:
         """
         Retrieve most similar document chunks for a given query.
 
         Performs semantic similarity search using the pre-built FAISS index
-        to find the most relevant text chunks for the input query.
+        to find the most relevant text chunks for the input query. A caller
+        that already embedded the query with the same model, normalized, can
+        pass ``query_embedding`` to skip encoding it again.
 
         """
         logger.debug(
@@ -307,40 +516,200 @@ class VectorDB:
             # Validate parameters
             self._validate_retrieval_parameters(query, top_k, threshold)
 
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode(
-                [query], show_progress_bar=False, convert_to_numpy=True
-            )
-
-            # Normalize for cosine similarity
-            faiss.normalize_L2(query_embedding)
+            # A document with no more chunks than requested is returned whole,
+            # in document order, without embedding the query
+            if len(self.chunks) <= top_k:
+                logger.debug("Document has at most top_k chunks, returning all")
+                return list(self.chunks)
+
+            # Repeated questions are answered without embedding them again
+            cache_key = self._query_cache_key(query, top_k, threshold)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                self._query_cache.move_to_end(cache_key)
+                logger.debug("Retrieval cache hit for query")
+                return list(cached[1])
+
+            # Generate normalized query embedding for cosine similarity
+            if query_embedding is None:
+                query_embedding = self._encode_queries([query])
+            else:
+                query_embedding = as_float32(query_embedding).reshape(1, -1)
+
+            # Rephrasings of a cached question reuse its results
+            similar = self._lookup_similar_query(query_embedding[0], top_k, threshold)
+            if similar is not None:
+                logger.debug("Retrieval cache hit for a similar query")
+                return list(similar)
 
             # Perform similarity search
-            scores, indices = self.index.search(
-                query_embedding.astype("float32"), min(top_k, len(self.chunks))
+            results = self._search(query_embedding, top_k, threshold)[0]
+
+            logger.info(
+                f"Retrieved {len(results)} relevant chunks (threshold: {threshold})"
             )
 
-            # Filter results by threshold and collect chunks
-            results = []
-            for idx, score in zip(indices[0], scores[0]):
-                if idx < len(self.chunks) and score > threshold:
-                    results.append(self.chunks[idx])
-                    logger.debug(
-                        f"Selected chunk {idx} with similarity score {score:.3f}"
-                    )
+            self._remember_query(cache_key, query_embedding[0], results)
+            return list(results)
+
+        except VectorDBError:
+            raise
+        except Exception as e:
+            error_msg = f"Unexpected error during retrieval: {e}"
+            logger.error(error_msg)
+            raise VectorDBError(error_msg) from e
+
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        top_k: int = DEFAULT_TOP_K,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> List[List[str]]:
+        """
+        Retrieve similar document chunks for several queries at once.
+
+        Queries not already cached are embedded in one batch and searched
+        with a single FAISS call.
+
+        Args:
+            queries (List[str]): Queries to search for
+            top_k (int): Maximum number of chunks per query
+            threshold (float): Minimum similarity score for a chunk
+
+        Returns:
+            List[List[str]]: Relevant chunks for each query, in query order
+        """
+        try:
+            if not self.is_indexed or self.index is None:
+                raise VectorDBError("Index not available - build index first")
+
+            for query in queries:
+                self._validate_retrieval_parameters(query, top_k, threshold)
+
+            if len(self.chunks) <= top_k:
+                return [list(self.chunks) for _ in queries]
+
+            keys = [self._query_cache_key(query, top_k, threshold) for query in queries]
+            results: List[Optional[List[str]]] = [None] * len(queries)
+            misses = []
+            for position, key in enumerate(keys):
+                cached = self._query_cache.get(key)
+                if cached is None:
+                    misses.append(position)
+                else:
+                    self._query_cache.move_to_end(key)
+                    results[position] = list(cached[1])
+
+            if misses:
+                embeddings = self._encode_queries([queries[i] for i in misses])
+                found = self._search(embeddings, top_k, threshold)
+                for position, embedding, chunks in zip(misses, embeddings, found):
+                    self._remember_query(keys[position], embedding, chunks)
+                    results[position] = list(chunks)
 
             logger.info(
-                f"Retrieved {len(results)} relevant chunks (threshold: {threshold})"
+                "Retrieved chunks for %s queries (%s searched)", len(queries), len(misses)
             )
             return results
 
         except VectorDBError:
             raise
         except Exception as e:
-            error_msg = f"Unexpected error during retrieval: {e}"
+            error_msg = f"Unexpected error during batch retrieval: {e}"
             logger.error(error_msg)
             raise VectorDBError(error_msg) from e
 
+    @staticmethod
+    def _query_cache_key(query: str, top_k: int, threshold: float) -> tuple:
+        """Return the retrieval cache key, ignoring case and spacing of the query."""
+        return (" ".join(query.lower().split()), top_k, threshold)
+
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed queries as unit-length float32 rows."""
+        embeddings = self.embedding_model.encode(
+            queries,
+            batch_size=self.ENCODE_BATCH_SIZE,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        return as_float32(embeddings)
+
+    def _search(
+        self, query_embeddings: np.ndarray, top_k: int, threshold: float
+    ) -> List[List[str]]:
+        """
+        Search the index for each embedding row and keep chunks above the threshold.
+
+        Args:
+            query_embeddings (np.ndarray): Normalized query embeddings, one per row
+            top_k (int): Maximum number of chunks per query
+            threshold (float): Minimum similarity score for a chunk
+
+        Returns:
+            List[List[str]]: Matching chunks for each row
+        """
+        scores, indices = self.index.search(
+            query_embeddings, min(top_k, len(self.chunks))
+        )
+
+        # Filter results by threshold over the whole matrix; approximate
+        # indexes pad rows they cannot fill with -1
+        keep = (scores > threshold) & (indices >= 0) & (indices < len(self.chunks))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            rows, columns = np.nonzero(keep)
+            logger.debug(
+                "Selected chunks:\n%s",
+                "\n".join(
+                    f"query {row}: chunk {indices[row, column]} "
+                    f"score {scores[row, column]:.3f}"
+                    for row, column in zip(rows.tolist(), columns.tolist())
+                ),
+            )
+
+        return [
+            [self.chunks[idx] for idx in row_indices[row_keep].tolist()]
+            for row_indices, row_keep in zip(indices, keep)
+        ]
+
+    def _remember_query(
+        self, cache_key: tuple, query_embedding: np.ndarray, results: List[str]
+    ) -> None:
+        """Cache retrieval results, evicting the least recently used query."""
+        self._query_cache[cache_key] = (query_embedding, results)
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+
+    def _lookup_similar_query(
+        self, query_embedding: np.ndarray, top_k: int, threshold: float
+    ) -> Optional[List[str]]:
+        """
+        Return cached results for the most similar earlier query, if close enough.
+
+        Args:
+            query_embedding (np.ndarray): Normalized query embedding
+            top_k (int): Number of chunks requested
+            threshold (float): Similarity threshold requested
+
+        Returns:
+            Optional[List[str]]: Cached chunks, or None on a miss
+        """
+        keys = [key for key in self._query_cache if key[1:] == (top_k, threshold)]
+        if not keys:
+            return None
+
+        # Embeddings are unit length, so one matrix-vector product gives cosines
+        similarities = (
+            np.stack([self._query_cache[key][0] for key in keys]) @ query_embedding
+        )
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.QUERY_CACHE_THRESHOLD:
+            return None
+
+        self._query_cache.move_to_end(keys[best])
+        return self._query_cache[keys[best]][1]
+
     def get_index_stats(self) -> dict:
         """
         Get comprehensive statistics about the current index.
@@ -352,6 +721,8 @@ class VectorDB:
             "is_indexed": self.is_indexed,
             "model_name": self.model_name,
             "chunk_count": len(self.chunks),
+            "word_count": self.word_count,
+            "char_count": self.char_count,
             "embedding_dimension": self.embedding_dimension,
             "index_size": self.index.ntotal if self.index else 0,
         }
@@ -379,6 +750,9 @@ class VectorDB:
             # Clear index and data
             self.index = None
             self.chunks.clear()
+            self._query_cache.clear()
+            self.word_count = 0
+            self.char_count = 0
             self.is_indexed = False
             self.embedding_dimension = None
 
@@ -390,9 +764,99 @@ class VectorDB:
             # Continue with reset even if there are errors
             self.index = None
             self.chunks = []
+            self._query_cache = OrderedDict()
+            self.word_count = 0
+            self.char_count = 0
             self.is_indexed = False
             self.embedding_dimension = None
 
+    def save(self, path: str) -> None:
+        """
+        Write the built index to ``{path}.faiss`` and its chunks to ``{path}.json``.
+
+        Each file is written under a temporary name unique to this call and
+        then moved into place, and the chunk file goes last, so a reader never
+        sees a partial index and concurrent saves of one document do not clash.
+
+        Args:
+            path (str): Destination path without extension
+
+        Raises:
+            VectorDBError: If the index is not built or cannot be written
+        """
+        if not self:
+            raise VectorDBError("Index not available - build index first")
+
+        tmp_suffix = f".{uuid.uuid4().hex}.tmp"
+        try:
+            faiss.write_index(self.index, f"{path}.faiss{tmp_suffix}")
+            os.replace(f"{path}.faiss{tmp_suffix}", f"{path}.faiss")
+
+            with open(f"{path}.json{tmp_suffix}", "w", encoding="utf-8") as meta_file:
+                json.dump(
+                    {
+                        "model_name": self.model_name,
+                        "word_count": self.word_count,
+                        "char_count": self.char_count,
+                        "chunks": self.chunks,
+                    },
+                    meta_file,
+                )
+            os.replace(f"{path}.json{tmp_suffix}", f"{path}.json")
+
+            logger.info("Saved index with %s vectors to %s", self.index.ntotal, path)
+
+        except Exception as e:
+            error_msg = f"Failed to save index to '{path}': {e}"
+            logger.error(error_msg)
+            raise VectorDBError(error_msg) from e
+        finally:
+            for extension in (".faiss", ".json"):
+                if os.path.exists(f"{path}{extension}{tmp_suffix}"):
+                    os.remove(f"{path}{extension}{tmp_suffix}")
+
+    def load(self, path: str) -> bool:
+        """
+        Load an index written by :meth:`save`, memory-mapping the vectors.
+
+        Args:
+            path (str): Index path without extension
+
+        Returns:
+            bool: True if the index was loaded, False if none was saved at
+            ``path`` for this embedding model
+        """
+        try:
+            with open(f"{path}.json", encoding="utf-8") as meta_file:
+                meta = json.load(meta_file)
+        except FileNotFoundError:
+            return False
+
+        if meta.get("model_name") != self.model_name:
+            logger.info("Ignoring index at %s built with another model", path)
+            return False
+
+        try:
+            # The index is only searched, so it can be mapped read-only and
+            # its pages shared by every process serving the same document
+            index = faiss.read_index(
+                f"{path}.faiss", faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load index from '{path}': {e}")
+            return False
+
+        self.index = index
+        self.chunks = meta["chunks"]
+        self.word_count = meta["word_count"]
+        self.char_count = meta.get("char_count", 0)  # Absent in older saves
+        self.embedding_dimension = index.d
+        self.is_indexed = True
+        self._query_cache.clear()
+
+        logger.info("Loaded index with %s vectors from %s", index.ntotal, path)
+        return True
+
     def __len__(self) -> int:
         """Return the number of indexed chunks."""
         return len(self.chunks)
@@ -1,14 +1,24 @@
 import streamlit as st
-import tweepy
 import requests
-from bs4 import BeautifulSoup
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import json
 import random
-import time
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from urllib.parse import quote_plus
 from dotenv import load_dotenv
 
+try:  # orjson: several times faster decoding of the streamed API chunks
+    import orjson
+    _loads_json = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _loads_json = json.loads
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -22,9 +32,44 @@ TWITTER_CONFIG = {
     'access_token': os.getenv('ACCESS_TOKEN', 'YOUR_ACCESS_TOKEN'),
     'access_token_secret': os.getenv('ACCESS_TOKEN_SECRET', 'YOUR_ACCESS_TOKEN_SECRET')
 }
+_TWITTER_ENABLED = all(value and not value.startswith('YOUR_') for value in TWITTER_CONFIG.values())
 
 PERPLEXITY_API_KEY = os.getenv('PERPLEXITY_API_KEY', 'YOUR_PERPLEXITY_API_KEY')
+_PERPLEXITY_ENABLED = bool(PERPLEXITY_API_KEY) and not PERPLEXITY_API_KEY.startswith('YOUR_')
 PERPLEXITY_API_URL = 'https://api.perplexity.ai/chat/completions'
+_NEWS_SEARCH_URL = 'https://news.google.com/search?q={}&hl=en-IN&gl=IN&ceid=IN:en'
+TWEET_CACHE_TTL = 300  # seconds a generation is reused for the same inputs
+
+_HEADLINE_SELECTOR = 'article h3, article h4'
+
+# Patterns used on every generation, compiled once
+_TWEET_PREFIX_RE = re.compile(r"^(Tweet:|Here's a tweet:|Here's|Natural tweet:)", re.IGNORECASE)
+_LEADING_HASH_RE = re.compile(r'^#')
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+# Prompt for natural tweets; only the topic, news and viewpoint vary per call
+_PROMPT_TEMPLATE = """You are an actual human Twitter user from India who tweets naturally about current events. Write a single, authentic tweet about this topic.
+
+TOPIC: {topic}
+
+{news_context}
+
+{pov_section}
+
+CRITICAL REQUIREMENTS - Make it sound COMPLETELY natural:
+• Write exactly how a real person would tweet - spontaneous, casual, with natural reactions
+• Use everyday language, not formal or corporate tone
+• Include genuine human emotions and reactions (excitement, skepticism, curiosity, etc.)
+• Maximum 280 characters
+• Include 1-2 relevant hashtags ONLY if they flow naturally
+• Avoid forced metaphors or trying too hard to be clever
+• Sound like you're genuinely reacting to this news
+
+EXAMPLES OF NATURAL HUMAN TWEETS:
+"Wait, this is actually happening? About time tbh 🙌"
+"Okay but who else thinks this sounds too good to be true? 🤔"
+
+Write ONE natural human tweet now:"""
 
 # =============================================================================
 # CORE FUNCTIONS (unchanged)
@@ -34,9 +79,11 @@ PERPLEXITY_API_URL = 'https://api.perplexity.ai/chat/completions'
 def setup_twitter_api():
     """Initialize Twitter API client"""
     try:
-        if any(key.startswith('YOUR_') for key in TWITTER_CONFIG.values()):
+        if not _TWITTER_ENABLED:
             return None
             
+        import tweepy  # Imported here so app start-up does not pay for it
+        
         client = tweepy.Client(
             consumer_key=TWITTER_CONFIG['consumer_key'],
             consumer_secret=TWITTER_CONFIG['consumer_secret'],
@@ -45,134 +92,225 @@ def setup_twitter_api():
             wait_on_rate_limit=True
         )
         
-        # Test authentication
-        me = client.get_me()
+        # Credentials are checked by the first create_tweet call rather than
+        # an extra get_me() round-trip before the page renders
         return client
     except Exception as e:
-        st.error(f"❌ Twitter API authentication failed: {e}")
+        st.error(f"❌ Twitter API setup failed: {e}")
         return None
 
-def get_focused_news_for_topic(topic):
-    """Get news headlines for a topic"""
+@st.cache_resource
+def get_http_session():
+    """Shared HTTP session so Google News searches reuse connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        # Back off only when Google News asks us to slow down
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 503])
+    )
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    return session
+
+@st.cache_resource
+def get_perplexity_client():
+    """Shared HTTP/2 client so concurrent generations multiplex over one connection"""
+    return httpx.Client(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        headers={'Authorization': f'Bearer {PERPLEXITY_API_KEY}'}
+    )
+
+@lru_cache(maxsize=1)
+def _bs4():
+    """Import BeautifulSoup on the first news fetch rather than at app start-up"""
+    from bs4 import BeautifulSoup, SoupStrainer
+    
+    # Only <article> elements of the news results page are built into the tree
+    return BeautifulSoup, SoupStrainer('article')
+
+def fetch_news_headlines(url):
+    """Fetch the top headlines for one Google News search URL"""
+    response = get_http_session().get(url, timeout=10)
+    BeautifulSoup, article_strainer = _bs4()
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=article_strainer)
+    
+    headlines = []
+    for headline_elem in soup.select(_HEADLINE_SELECTOR, limit=3):
+        headline = headline_elem.get_text().strip()
+        if len(headline) > 20:
+            headlines.append(headline)
+    return headlines
+
+class PartialHeadlinesError(Exception):
+    """Some news searches failed; carries the headlines the others found"""
+    def __init__(self, headlines, failures):
+        super().__init__(f"{len(failures)} news searches failed")
+        self.headlines = headlines
+        self.failures = failures
+
+@st.cache_data(ttl=600, show_spinner=False, max_entries=128)
+def _fetch_headlines(topic):
+    """Get news headlines for a normalized topic; only complete results are cached"""
+    search_queries = [
+        f"{topic} India latest news today",
+        f"{topic} breaking news India", 
+        f"{topic} update India 2025"
+    ]
+    urls = [_NEWS_SEARCH_URL.format(quote_plus(query)) for query in search_queries]
+    
+    # Run the searches concurrently, without waiting on stragglers once
+    # enough unique headlines are in
+    results = [[] for _ in search_queries]
+    failures = []
+    seen = set()
+    executor = ThreadPoolExecutor(max_workers=len(search_queries))
     try:
-        all_headlines = []
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        futures = {
+            executor.submit(fetch_news_headlines, url): i
+            for i, url in enumerate(urls)
         }
-        
-        search_queries = [
-            f"{topic} India latest news today",
-            f"{topic} breaking news India", 
-            f"{topic} update India 2025"
-        ]
-        
-        progress_bar = st.progress(0)
-        for i, query in enumerate(search_queries):
+        for future in as_completed(futures):
+            i = futures[future]
             try:
-                url = f"https://news.google.com/search?q={quote_plus(query)}&hl=en-IN&gl=IN&ceid=IN:en"
-                response = requests.get(url, headers=headers, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                articles = soup.find_all('article')[:3]
-                for article in articles:
-                    headline_elem = article.find(['h3', 'h4'])
-                    if headline_elem:
-                        headline = headline_elem.get_text().strip()
-                        if headline and len(headline) > 20 and headline not in all_headlines:
-                            all_headlines.append(headline)
-                
-                progress_bar.progress((i + 1) / len(search_queries))
-                time.sleep(1)
-                
+                results[i] = future.result()
             except Exception as e:
-                st.warning(f"Error with query '{query}': {e}")
+                failures.append((search_queries[i], str(e)))
                 continue
+            seen.update(headline.casefold() for headline in results[i])
+            if len(seen) >= 5:
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # Nothing to cache if every search failed
+    if len(failures) == len(search_queries):
+        raise RuntimeError(failures[0][1])
+    
+    # Keep query order, dropping repeats that differ only in case
+    seen.clear()
+    all_headlines = []
+    for headlines in results:
+        for headline in headlines:
+            key = headline.casefold()
+            if key not in seen:
+                seen.add(key)
+                all_headlines.append(headline)
+        if len(all_headlines) >= 5:
+            break
+    all_headlines = all_headlines[:5]
+    
+    # Raised rather than returned so a degraded list is not cached
+    if failures:
+        raise PartialHeadlinesError(all_headlines, failures)
+    return all_headlines
+
+def get_focused_news_for_topic(topic):
+    """Get news headlines for a topic; complete results are cached for 10 minutes"""
+    try:
+        return _fetch_headlines(topic.strip().lower())
         
-        progress_bar.empty()
-        return all_headlines[:5]
-        
+    except PartialHeadlinesError as e:
+        for query, error in e.failures:
+            st.warning(f"Error with query '{query}': {error}")
+        return e.headlines
     except Exception as e:
         st.error(f"❌ Error collecting news: {e}")
         return []
 
-def generate_natural_human_tweet(topic, headlines, user_pov=None):
-    """Generate natural human-like tweet"""
+def _build_tweet_prompt(topic, headlines, user_pov):
+    """Build the Perplexity prompt for a tweet"""
+    # Create news context
+    if headlines:
+        news_context = "Recent news:\n" + "\n".join([f"• {h}" for h in headlines[:3]])
+    else:
+        news_context = "No specific news context available"
+    
+    pov_section = f"YOUR PERSPECTIVE: {user_pov}" if user_pov else ""
+    return _PROMPT_TEMPLATE.format(topic=topic, news_context=news_context, pov_section=pov_section)
+
+def _stream_perplexity(prompt):
+    """Yield tweet text from Perplexity as it is generated"""
+    payload = {
+        "model": "sonar",
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": 150,
+        "temperature": 0.9,
+        "stream": True
+    }
+    
+    with get_perplexity_client().stream('POST', PERPLEXITY_API_URL, json=payload) as response:
+        if response.status_code != 200:
+            raise httpx.HTTPStatusError(
+                f"Perplexity API error: {response.status_code}",
+                request=response.request,
+                response=response
+            )
+        
+        # Server-sent events: one "data: {json}" line per chunk
+        for line in response.iter_lines():
+            if not line.startswith('data: '):
+                continue
+            data = line[6:]
+            if data == '[DONE]':
+                break
+            choices = _loads_json(data).get('choices') or [{}]
+            delta = choices[0].get('delta', {}).get('content')
+            if delta:
+                yield delta
+
+def _clean_tweet(tweet):
+    """Strip model preambles and quotes, and keep within 280 characters"""
+    tweet = _TWEET_PREFIX_RE.sub('', tweet.strip()).strip()
+    tweet = tweet.strip('"\'')
+    
+    # Ensure character limit
+    if len(tweet) > 280:
+        if '.' in tweet:
+            # Keep only the first sentence
+            tweet = tweet.partition('.')[0].strip()
+            tweet = tweet if tweet[-1:] in ('.', '!', '?') else tweet + '.'
+        else:
+            tweet = tweet[:277] + "..."
+    
+    return tweet
+
+def generate_natural_human_tweet(topic, headlines, user_pov=None, nonce=0):
+    """Generate natural human-like tweet, streaming it in as it is written"""
     try:
-        if PERPLEXITY_API_KEY.startswith('YOUR_'):
+        if not _PERPLEXITY_ENABLED:
             st.error("❌ Please set your Perplexity API key in the .env file")
             return None
-            
-        # Create news context
-        news_context = ""
-        if headlines:
-            news_context = "Recent news:\n" + "\n".join([f"• {h}" for h in headlines[:3]])
-        else:
-            news_context = "No specific news context available"
         
-        # Enhanced prompt for natural tweets
-        prompt = f"""You are an actual human Twitter user from India who tweets naturally about current events. Write a single, authentic tweet about this topic.
-
-TOPIC: {topic}
-
-{news_context}
-
-{f"YOUR PERSPECTIVE: {user_pov}" if user_pov else ""}
-
-CRITICAL REQUIREMENTS - Make it sound COMPLETELY natural:
-• Write exactly how a real person would tweet - spontaneous, casual, with natural reactions
-• Use everyday language, not formal or corporate tone
-• Include genuine human emotions and reactions (excitement, skepticism, curiosity, etc.)
-• Maximum 280 characters
-• Include 1-2 relevant hashtags ONLY if they flow naturally
-• Avoid forced metaphors or trying too hard to be clever
-• Sound like you're genuinely reacting to this news
-
-EXAMPLES OF NATURAL HUMAN TWEETS:
-"Wait, this is actually happening? About time tbh 🙌"
-"Okay but who else thinks this sounds too good to be true? 🤔"
-"Finally some good news today. Let's see if it actually works out"
-"This is either genius or complete chaos. No in between lol"
-
-Write ONE natural human tweet now:"""
-
-        headers = {
-            'Authorization': f'Bearer {PERPLEXITY_API_KEY}',
-            'Content-Type': 'application/json'
-        }
+        # Generations are reused for 5 minutes per inputs; nonce forces a fresh one
+        key = (topic, tuple(headlines or ()), user_pov, nonce)
+        cached = st.session_state.tweet_cache.get(key)
+        if cached and time.monotonic() - cached[0] < TWEET_CACHE_TTL:
+            return cached[1]
         
-        payload = {
-            "model": "sonar",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 150,
-            "temperature": 0.9
-        }
+        placeholder = st.empty()
+        chunks = []
+        for delta in _stream_perplexity(_build_tweet_prompt(topic, headlines, user_pov)):
+            chunks.append(delta)
+            placeholder.markdown("".join(chunks))
+        placeholder.empty()
         
-        with st.spinner("🤖 Generating natural human tweet..."):
-            response = requests.post(PERPLEXITY_API_URL, headers=headers, json=payload, timeout=30)
-            
-        if response.status_code == 200:
-            result = response.json()
-            tweet = result['choices'][0]['message']['content'].strip()
-            
-            # Clean up the tweet
-            tweet = re.sub(r'^(Tweet:|Here\'s a tweet:|Here\'s|Natural tweet:)', '', tweet, flags=re.IGNORECASE).strip()
-            tweet = tweet.strip('"\'')
-            
-            # Ensure character limit
-            if len(tweet) > 280:
-                if '.' in tweet:
-                    sentences = tweet.split('.')
-                    tweet = sentences[0].strip()
-                    if not tweet.endswith(('.', '!', '?')):
-                        tweet += '.'
-                else:
-                    tweet = tweet[:277] + "..."
-            
-            return tweet
-        else:
-            st.error(f"❌ Perplexity API error: {response.status_code}")
-            return None
+        tweet = _clean_tweet("".join(chunks))
+        if tweet:
+            now = time.monotonic()
+            cache = st.session_state.tweet_cache
+            for stale in [k for k, (t, _) in cache.items() if now - t >= TWEET_CACHE_TTL]:
+                del cache[stale]
+            cache[key] = (now, tweet)
+        return tweet
             
+    except httpx.HTTPStatusError as e:
+        st.error(f"❌ {e}")
+        return None
     except Exception as e:
         st.error(f"❌ Error generating tweet: {e}")
         return None
@@ -281,6 +419,10 @@ def main():
         st.session_state.current_topic = ""
     if 'tweet_posted' not in st.session_state:
         st.session_state.tweet_posted = False
+    if 'tweet_cache' not in st.session_state:
+        st.session_state.tweet_cache = {}  # (topic, headlines, pov, nonce) -> (time, tweet)
+    if 'regen_nonce' not in st.session_state:
+        st.session_state.regen_nonce = 0  # Bumped to bypass cached generations
     
     # Mobile-optimized input section
     st.markdown("### 💬 What's Trending?")
@@ -326,7 +468,7 @@ def main():
             # Reset posting status when generating new tweet
             st.session_state.tweet_posted = False
             
-            clean_topic = re.sub(r'^#', '', topic.strip())
+            clean_topic = _LEADING_HASH_RE.sub('', topic.strip())
             st.session_state.current_topic = clean_topic
             
             st.markdown(f"""
@@ -347,7 +489,9 @@ def main():
                     st.write("⚠️ Using topic-based generation")
                 
                 st.write("🤖 Crafting natural tweet...")
-                tweet = generate_natural_human_tweet(clean_topic, headlines, user_pov.strip() or None)
+                tweet = generate_natural_human_tweet(
+                    clean_topic, headlines, user_pov.strip() or None, st.session_state.regen_nonce
+                )
                 
                 if tweet:
                     # Store both original and editable versions - BUG FIX
@@ -363,22 +507,16 @@ def main():
         st.markdown("---")
         st.markdown("### 📝 Your Tweet")
         
-        # Editable tweet with bug fix - ensure editable_tweet is never None
-        current_editable = st.session_state.editable_tweet or ""
-        edited_tweet = st.text_area(
+        # editable_tweet only seeds the editor when a tweet is generated; the
+        # widget keeps the user's edits in its own session state slot
+        st.text_area(
             "Edit your tweet:",
-            value=current_editable,
+            value=st.session_state.editable_tweet,
             height=120,
             max_chars=280,
             key="tweet_editor"
         )
-        
-        # Update editable version when user makes changes - BUG FIX
-        if edited_tweet != st.session_state.editable_tweet:
-            st.session_state.editable_tweet = edited_tweet or ""
-        
-        # Ensure editable_tweet is never None before getting length - BUG FIX
-        editable_tweet_text = st.session_state.editable_tweet or ""
+        editable_tweet_text = st.session_state.get("tweet_editor", "") or ""
         char_count = len(editable_tweet_text)
         
         # Mobile-optimized metrics
@@ -389,7 +527,7 @@ def main():
             hashtags = editable_tweet_text.count('#')
             st.metric("Hashtags", hashtags)
         with col3:
-            emojis = len([c for c in editable_tweet_text if ord(c) > 127])
+            emojis = len(_NON_ASCII_RE.findall(editable_tweet_text))
             st.metric("Emojis", emojis)
         
         # Warning for character limit
@@ -434,11 +572,13 @@ def main():
         
         # Generate new tweet button
         if st.button("🔄 Generate New Tweet", use_container_width=True):
+            st.session_state.regen_nonce += 1
             with st.spinner("Creating new tweet..."):
                 new_tweet = generate_natural_human_tweet(
                     st.session_state.current_topic, 
                     st.session_state.headlines, 
-                    user_pov.strip() or None if 'user_pov' in locals() else None
+                    user_pov.strip() or None if 'user_pov' in locals() else None,
+                    st.session_state.regen_nonce
                 )
                 if new_tweet:
                     st.session_state.generated_tweet = new_tweet